@@ -0,0 +1,9 @@
+"""Version information for pysatSpaceWeather.
+
+Note
+----
+Must be kept in sync with the version in `pyproject.toml` and `setup.cfg`.
+
+"""
+
+__version__ = '0.2.1'
@@ -1,9 +1,53 @@
-from pysatSpaceWeather.instruments import methods  # noqa F401
+"""Instrument modules for pysatSpaceWeather.
+
+Note
+----
+Instrument and method sub-modules are imported the first time they are
+accessed as attributes of this package, so that importing pysatSpaceWeather
+does not require every Instrument to be loaded.
+
+"""
+
+import importlib
 
 __all__ = ['ace_epam', 'ace_mag', 'ace_sis', 'ace_swepam', 'norp_rf', 'sw_ae',
            'sw_al', 'sw_au', 'sw_ap', 'sw_apo', 'sw_cp', 'sw_dst', 'sw_f107',
            'sw_flare', 'sw_hpo', 'sw_kp', 'sw_mgii', 'sw_polarcap',
            'sw_sbfield', 'sw_ssn', 'sw_stormprob']
 
-for inst in __all__:
-    exec("from pysatSpaceWeather.instruments import {inst}".format(inst=inst))
+_lazy_modules = frozenset(__all__ + ['methods'])
+
+
+def __getattr__(name):
+    """Import Instrument and method sub-modules on first access.
+
+    Parameters
+    ----------
+    name : str
+        Name of the desired sub-module
+
+    Returns
+    -------
+    module : module
+        Imported sub-module
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a sub-module of this package
+
+    """
+
+    if name in _lazy_modules:
+        module = importlib.import_module(".".join([__name__, name]))
+        globals()[name] = module
+        return module
+
+    raise AttributeError("module {:} has no attribute {:}".format(
+        repr(__name__), repr(name)))
+
+
+def __dir__():
+    """List the module attributes, including sub-modules not yet imported."""
+
+    return sorted(set(globals().keys()) | _lazy_modules)
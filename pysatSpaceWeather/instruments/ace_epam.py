@@ -52,7 +52,6 @@ import datetime as dt
 import functools
 import numpy as np
 
-from pysat.instruments.methods.general import load_csv_data
 from pysat import logger
 
 from pysatSpaceWeather.instruments.methods import ace as mm_ace
@@ -65,9 +64,69 @@ platform = 'ace'
 name = 'epam'
 tags = {'realtime': 'Real-time data from the SWPC',
         'historic': ' Historic data from the SWPC'}
-inst_ids = {inst_id: [tag for tag in tags.keys()] for inst_id in ['']}
-
-# Define today's date
+inst_ids = {'': list(tags.keys())}
+
+# Define the metadata for each data variable, keyed by the `pysat.MetaLabels`
+# attribute names
+_flux_desc = '5-min averaged Differential '
+_flux_units = 'particles/cm2-s-ster-MeV'
+_var_meta = {
+    'status_e': {'units': '', 'name': 'Diff e- Flux Status', 'notes': '',
+                 'desc': mm_ace.status_desc,
+                 'fill_val': mm_ace.status_fill, 'min_val': 0, 'max_val': 9},
+    'status_p': {'units': '', 'name': 'Diff Proton Flux Status', 'notes': '',
+                 'desc': mm_ace.status_desc,
+                 'fill_val': mm_ace.status_fill, 'min_val': 0, 'max_val': 9},
+    'anis_ind': {'units': '', 'name': 'Anisotropy Index', 'notes': '',
+                 'desc': 'Range: 0.0 - 2.0', 'fill_val': -1.0, 'min_val': 0.0,
+                 'max_val': 2.0},
+    'eflux_38-53': {'units': _flux_units, 'name': 'Diff e- Flux 38-53 eV',
+                    'notes': '',
+                    'desc': ''.join([_flux_desc,
+                                     'Electron Flux between 35-53 eV']),
+                    'fill_val': -1.0e5, 'min_val': -np.inf,
+                    'max_val': np.inf},
+    'eflux_175-315': {'units': _flux_units, 'name': 'Diff e- Flux 175-315 eV',
+                      'notes': '',
+                      'desc': ''.join([_flux_desc,
+                                       'Electron Flux between 175-315 eV']),
+                      'fill_val': -1.0e5, 'min_val': -np.inf,
+                      'max_val': np.inf},
+    'pflux_47-68': {'units': _flux_units, 'name': 'Diff Proton Flux 47-68 keV',
+                    'notes': '',
+                    'desc': ''.join([_flux_desc,
+                                     'Proton Flux between 47-68 keV']),
+                    'fill_val': -1.0e5, 'min_val': -np.inf,
+                    'max_val': np.inf},
+    'pflux_115-195': {'units': _flux_units,
+                      'name': 'Diff Proton Flux 115-195 keV', 'notes': '',
+                      'desc': ''.join([_flux_desc,
+                                       'Proton Flux between 115-195 keV']),
+                      'fill_val': -1.0e5, 'min_val': -np.inf,
+                      'max_val': np.inf},
+    'pflux_310-580': {'units': _flux_units,
+                      'name': 'Diff Proton Flux 310-580 keV', 'notes': '',
+                      'desc': ''.join([_flux_desc,
+                                       'Proton Flux between 310-580 keV']),
+                      'fill_val': -1.0e5, 'min_val': -np.inf,
+                      'max_val': np.inf},
+    'pflux_795-1193': {'units': _flux_units,
+                       'name': 'Diff Proton Flux 795-1193 keV', 'notes': '',
+                       'desc': ''.join([_flux_desc,
+                                        'Proton Flux between 795-1193 keV']),
+                       'fill_val': -1.0e5, 'min_val': -np.inf,
+                       'max_val': np.inf},
+    'pflux_1060-1900': {'units': _flux_units,
+                        'name': 'Diff Proton Flux 1060-1900 keV', 'notes': '',
+                        'desc': ''.join([_flux_desc,
+                                         'Proton Flux between 1060-1900 keV']),
+                        'fill_val': -1.0e5, 'min_val': -np.inf,
+                        'max_val': np.inf}}
+
+# Define the file loading kwargs, including the data types of each column
+_read_csv_kwargs = mm_ace.get_read_csv_kwargs(_var_meta)
+
+# Define today's date for the test attributes
 now = dt.datetime.now(tz=dt.timezone.utc)
 
 # ----------------------------------------------------------------------------
@@ -115,23 +174,24 @@ def clean(self):
 
     # Replace bad values with NaN and remove times with no valid data
     ecols = ['eflux_38-53', 'eflux_175-315']
-
-    # Evaluate the electron flux data
-    self[self.data['status_e'] > max_status, ecols] = np.nan
-
-    # Evaluate the proton flux data
     pcols = ['pflux_47-68', 'pflux_115-195', 'pflux_310-580',
              'pflux_795-1193', 'pflux_1060-1900']
-    self[self.data['status_p'] > max_status, pcols] = np.nan
 
     # Include both fluxes and the anisotropy index in the removal eval
     eval_cols = ecols + pcols
     eval_cols.append('anis_ind')
 
+    # Evaluate the electron and proton flux data in a single array, where the
+    # electron fluxes are followed by the proton fluxes
+    eval_data = self.data[eval_cols].to_numpy(dtype=np.float64, copy=True)
+    eval_data[self.data['status_e'].to_numpy() > max_status,
+              :len(ecols)] = np.nan
+    eval_data[self.data['status_p'].to_numpy() > max_status,
+              len(ecols):len(eval_cols) - 1] = np.nan
+    self.data[eval_cols] = eval_data
+
     # Remove lines without any good data
-    good_cols = (np.isfinite(self.data.loc[:, eval_cols])).sum(axis=1)
-    bad_index = good_cols[good_cols == 0].index
-    self.data = self.data.drop(index=bad_index)
+    self.data = self.data[np.isfinite(eval_data).any(axis=1)]
 
     return
 
@@ -139,7 +199,7 @@ def clean(self):
 # ----------------------------------------------------------------------------
 # Instrument functions
 
-download = functools.partial(mm_ace.download, name=name, now=now)
+download = functools.partial(mm_ace.download, name=name)
 list_files = functools.partial(mm_ace.list_files, name=name)
 
 
@@ -164,7 +224,7 @@ def load(fnames, tag='', inst_id=''):
 
     See Also
     --------
-    pysat.instruments.methods.general.load_csv_data
+    pysatSpaceWeather.instruments.methods.general.load_csv_data
 
     Note
     ----
@@ -173,96 +233,12 @@ def load(fnames, tag='', inst_id=''):
     """
 
     # Save each file to the output DataFrame
-    data = load_csv_data(fnames, read_csv_kwargs={'index_col': 0,
-                                                  'parse_dates': True})
+    data = general.load_csv_data(fnames, read_csv_kwargs=_read_csv_kwargs)
+    data = mm_ace.convert_index_unit(data)
+    data = mm_ace.convert_status_dtype(data)
 
     # Assign the meta data
-    meta, status_desc = mm_ace.common_metadata()
-    flux_desc = '5-min averaged Differential '
-
-    meta['status_e'] = {meta.labels.units: '',
-                        meta.labels.name: 'Diff e- Flux Status',
-                        meta.labels.notes: '',
-                        meta.labels.desc: status_desc,
-                        meta.labels.fill_val: np.nan,
-                        meta.labels.min_val: 0,
-                        meta.labels.max_val: 9}
-    meta['status_p'] = {meta.labels.units: '',
-                        meta.labels.name: 'Diff Proton Flux Status',
-                        meta.labels.notes: '',
-                        meta.labels.desc: status_desc,
-                        meta.labels.fill_val: np.nan,
-                        meta.labels.min_val: 0,
-                        meta.labels.max_val: 9}
-    meta['anis_ind'] = {meta.labels.units: '',
-                        meta.labels.name: 'Anisotropy Index',
-                        meta.labels.notes: '',
-                        meta.labels.desc: 'Range: 0.0 - 2.0',
-                        meta.labels.fill_val: -1.0,
-                        meta.labels.min_val: 0.0,
-                        meta.labels.max_val: 2.0}
-    meta['eflux_38-53'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                           meta.labels.name: 'Diff e- Flux 38-53 eV',
-                           meta.labels.notes: '',
-                           meta.labels.desc:
-                           ''.join([flux_desc,
-                                    'Electron Flux between 35-53 eV']),
-                           meta.labels.fill_val: -1.0e5,
-                           meta.labels.min_val: -np.inf,
-                           meta.labels.max_val: np.inf}
-    meta['eflux_175-315'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                             meta.labels.name: 'Diff e- Flux 175-315 eV',
-                             meta.labels.notes: '',
-                             meta.labels.desc:
-                             ''.join([flux_desc,
-                                      'Electron Flux between 175-315 eV']),
-                             meta.labels.fill_val: -1.0e5,
-                             meta.labels.min_val: -np.inf,
-                             meta.labels.max_val: np.inf}
-    meta['pflux_47-68'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                           meta.labels.name: 'Diff Proton Flux 47-68 keV',
-                           meta.labels.notes: '',
-                           meta.labels.desc:
-                           ''.join([flux_desc,
-                                    'Proton Flux between 47-68 keV']),
-                           meta.labels.fill_val: -1.0e5,
-                           meta.labels.min_val: -np.inf,
-                           meta.labels.max_val: np.inf}
-    meta['pflux_115-195'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                             meta.labels.name: 'Diff Proton Flux 115-195 keV',
-                             meta.labels.notes: '',
-                             meta.labels.desc:
-                             ''.join([flux_desc,
-                                      'Proton Flux between 115-195 keV']),
-                             meta.labels.fill_val: -1.0e5,
-                             meta.labels.min_val: -np.inf,
-                             meta.labels.max_val: np.inf}
-    meta['pflux_310-580'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                             meta.labels.name: 'Diff Proton Flux 310-580 keV',
-                             meta.labels.notes: '',
-                             meta.labels.desc:
-                             ''.join([flux_desc,
-                                      'Proton Flux between 310-580 keV']),
-                             meta.labels.fill_val: -1.0e5,
-                             meta.labels.min_val: -np.inf,
-                             meta.labels.max_val: np.inf}
-    meta['pflux_795-1193'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                              meta.labels.name: 'Diff Proton Flux 795-1193 keV',
-                              meta.labels.notes: '',
-                              meta.labels.desc:
-                              ''.join([flux_desc,
-                                       'Proton Flux between 795-1193 keV']),
-                              meta.labels.fill_val: -1.0e5,
-                              meta.labels.min_val: -np.inf,
-                              meta.labels.max_val: np.inf}
-    meta['pflux_1060-1900'] = {meta.labels.units: 'particles/cm2-s-ster-MeV',
-                               meta.labels.name:
-                               'Diff Proton Flux 1060-1900 keV',
-                               meta.labels.notes: '',
-                               meta.labels.desc:
-                               ''.join([flux_desc,
-                                        'Proton Flux between 1060-1900 keV']),
-                               meta.labels.fill_val: -1.0e5,
-                               meta.labels.min_val: -np.inf,
-                               meta.labels.max_val: np.inf}
+    meta, _ = mm_ace.common_metadata()
+    mm_ace.update_metadata(meta, _var_meta)
+
     return data, meta
@@ -52,7 +52,6 @@ import datetime as dt
 import functools
 import numpy as np
 
-from pysat.instruments.methods.general import load_csv_data
 from pysat import logger
 
 from pysatSpaceWeather.instruments.methods import ace as mm_ace
@@ -65,9 +64,37 @@ platform = 'ace'
 name = 'mag'
 tags = {'realtime': 'Real-time data from the SWPC',
         'historic': ' Historic data from the SWPC'}
-inst_ids = {inst_id: [tag for tag in tags.keys()] for inst_id in ['']}
-
-# Define today's date
+inst_ids = {'': list(tags.keys())}
+
+# Define the metadata for each data variable, keyed by the `pysat.MetaLabels`
+# attribute names
+_var_meta = {
+    'status': {'units': '', 'name': 'Status', 'notes': '',
+               'desc': mm_ace.status_desc,
+               'fill_val': mm_ace.status_fill, 'min_val': 0, 'max_val': 9},
+    'bx_gsm': {'units': 'nT', 'name': 'Bx GSM', 'notes': '',
+               'desc': '1-min averaged IMF Bx', 'fill_val': -999.9,
+               'min_val': -np.inf, 'max_val': np.inf},
+    'by_gsm': {'units': 'nT', 'name': 'By GSM', 'notes': '',
+               'desc': '1-min averaged IMF By', 'fill_val': -999.9,
+               'min_val': -np.inf, 'max_val': np.inf},
+    'bz_gsm': {'units': 'nT', 'name': 'Bz GSM', 'notes': '',
+               'desc': '1-min averaged IMF Bz', 'fill_val': -999.9,
+               'min_val': -np.inf, 'max_val': np.inf},
+    'bt_gsm': {'units': 'nT', 'name': 'Bt GSM', 'notes': '',
+               'desc': '1-min averaged IMF Bt', 'fill_val': -999.9,
+               'min_val': -np.inf, 'max_val': np.inf},
+    'lat_gsm': {'units': 'degrees', 'name': 'GSM Lat', 'notes': '',
+                'desc': 'GSM Latitude', 'fill_val': -999.9, 'min_val': -90.0,
+                'max_val': 90.0},
+    'lon_gsm': {'units': 'degrees', 'name': 'GSM Lon', 'notes': '',
+                'desc': 'GSM Longitude', 'fill_val': -999.9, 'min_val': 0.0,
+                'max_val': 360.0}}
+
+# Define the file loading kwargs, including the data types of each column
+_read_csv_kwargs = mm_ace.get_read_csv_kwargs(_var_meta)
+
+# Define today's date for the test attributes
 now = dt.datetime.now(tz=dt.timezone.utc)
 
 # ----------------------------------------------------------------------------
@@ -114,7 +141,7 @@ def clean(self):
     max_status = mm_ace.clean(self)
 
     # Replace bad values with NaN and remove times with no valid data
-    self.data = self.data[self.data['status'] <= max_status]
+    self.data = self.data[self.data['status'].to_numpy() <= max_status]
 
     return
 
@@ -122,7 +149,7 @@ def clean(self):
 # ----------------------------------------------------------------------------
 # Instrument functions
 
-download = functools.partial(mm_ace.download, name=name, now=now)
+download = functools.partial(mm_ace.download, name=name)
 list_files = functools.partial(mm_ace.list_files, name=name)
 
 
@@ -147,7 +174,7 @@ def load(fnames, tag='', inst_id=''):
 
     See Also
     --------
-    pysat.instruments.methods.general.load_csv_data
+    pysatSpaceWeather.instruments.methods.general.load_csv_data
 
     Note
     ----
@@ -156,60 +183,12 @@ def load(fnames, tag='', inst_id=''):
     """
 
     # Save each file to the output DataFrame
-    data = load_csv_data(fnames, read_csv_kwargs={'index_col': 0,
-                                                  'parse_dates': True})
+    data = general.load_csv_data(fnames, read_csv_kwargs=_read_csv_kwargs)
+    data = mm_ace.convert_index_unit(data)
+    data = mm_ace.convert_status_dtype(data)
 
     # Assign the meta data
-    meta, status_desc = mm_ace.common_metadata()
-
-    meta['status'] = {meta.labels.units: '',
-                      meta.labels.name: 'Status',
-                      meta.labels.notes: '',
-                      meta.labels.desc: status_desc,
-                      meta.labels.fill_val: np.nan,
-                      meta.labels.min_val: 0,
-                      meta.labels.max_val: 9}
-    meta['bx_gsm'] = {meta.labels.units: 'nT',
-                      meta.labels.name: 'Bx GSM',
-                      meta.labels.notes: '',
-                      meta.labels.desc: '1-min averaged IMF Bx',
-                      meta.labels.fill_val: -999.9,
-                      meta.labels.min_val: -np.inf,
-                      meta.labels.max_val: np.inf}
-    meta['by_gsm'] = {meta.labels.units: 'nT',
-                      meta.labels.name: 'By GSM',
-                      meta.labels.notes: '',
-                      meta.labels.desc: '1-min averaged IMF By',
-                      meta.labels.fill_val: -999.9,
-                      meta.labels.min_val: -np.inf,
-                      meta.labels.max_val: np.inf}
-    meta['bz_gsm'] = {meta.labels.units: 'nT',
-                      meta.labels.notes: '',
-                      meta.labels.name: 'Bz GSM',
-                      meta.labels.desc: '1-min averaged IMF Bz',
-                      meta.labels.fill_val: -999.9,
-                      meta.labels.min_val: -np.inf,
-                      meta.labels.max_val: np.inf}
-    meta['bt_gsm'] = {meta.labels.units: 'nT',
-                      meta.labels.name: 'Bt GSM',
-                      meta.labels.notes: '',
-                      meta.labels.desc: '1-min averaged IMF Bt',
-                      meta.labels.fill_val: -999.9,
-                      meta.labels.min_val: -np.inf,
-                      meta.labels.max_val: np.inf}
-    meta['lat_gsm'] = {meta.labels.units: 'degrees',
-                       meta.labels.name: 'GSM Lat',
-                       meta.labels.notes: '',
-                       meta.labels.desc: 'GSM Latitude',
-                       meta.labels.fill_val: -999.9,
-                       meta.labels.min_val: -90.0,
-                       meta.labels.max_val: 90.0}
-    meta['lon_gsm'] = {meta.labels.units: 'degrees',
-                       meta.labels.name: 'GSM Lon',
-                       meta.labels.notes: '',
-                       meta.labels.desc: 'GSM Longitude',
-                       meta.labels.fill_val: -999.9,
-                       meta.labels.min_val: 0.0,
-                       meta.labels.max_val: 360.0}
+    meta, _ = mm_ace.common_metadata()
+    mm_ace.update_metadata(meta, _var_meta)
 
     return data, meta
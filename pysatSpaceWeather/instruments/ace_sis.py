@@ -52,7 +52,6 @@ import datetime as dt
 import functools
 import numpy as np
 
-from pysat.instruments.methods.general import load_csv_data
 from pysat import logger
 
 from pysatSpaceWeather.instruments.methods import ace as mm_ace
@@ -65,9 +64,39 @@ platform = 'ace'
 name = 'sis'
 tags = {'realtime': 'Real-time data from the SWPC',
         'historic': ' Historic data from the SWPC'}
-inst_ids = {inst_id: [tag for tag in tags.keys()] for inst_id in ['']}
-
-# Define today's date
+inst_ids = {'': list(tags.keys())}
+
+# Define the metadata for each data variable, keyed by the `pysat.MetaLabels`
+# attribute names
+_flux_name = 'Integral Proton Flux'
+_var_meta = {
+    'status_10': {'units': '', 'name': ''.join([_flux_name,
+                                                ' > 10 MeV Status']),
+                  'notes': '', 'desc': mm_ace.status_desc,
+                  'fill_val': mm_ace.status_fill, 'min_val': 0, 'max_val': 9},
+    'status_30': {'units': '', 'name': ''.join([_flux_name,
+                                                ' > 30 MeV Status']),
+                  'notes': '', 'desc': mm_ace.status_desc,
+                  'fill_val': mm_ace.status_fill, 'min_val': 0, 'max_val': 9},
+    'int_pflux_10MeV': {'units': 'p/cs2-sec-ster',
+                        'name': ''.join([_flux_name, ' > 10 MeV']),
+                        'notes': '',
+                        'desc': ''.join(['5-min averaged ', _flux_name,
+                                         ' > 10 MeV']),
+                        'fill_val': -1.0e5, 'min_val': -np.inf,
+                        'max_val': np.inf},
+    'int_pflux_30MeV': {'units': 'p/cs2-sec-ster',
+                        'name': ''.join([_flux_name, ' > 30 MeV']),
+                        'notes': '',
+                        'desc': ''.join(['5-min averaged ', _flux_name,
+                                         ' > 30 MeV']),
+                        'fill_val': -1.0e5, 'min_val': -np.inf,
+                        'max_val': np.inf}}
+
+# Define the file loading kwargs, including the data types of each column
+_read_csv_kwargs = mm_ace.get_read_csv_kwargs(_var_meta)
+
+# Define today's date for the test attributes
 now = dt.datetime.now(tz=dt.timezone.utc)
 
 # ----------------------------------------------------------------------------
@@ -115,17 +144,15 @@ def clean(self):
 
     # Evaluate the different proton fluxes. Replace bad values with NaN and
     # times with no valid data
-    self.data['int_pflux_10MeV'] = self.data['int_pflux_10MeV'].where(
-        (self.data['status_10'] <= max_status), other=np.nan)
-    self.data['int_pflux_30MeV'] = self.data['int_pflux_30MeV'].where(
-        (self.data['status_30'] <= max_status), other=np.nan)
-
     eval_cols = ['int_pflux_10MeV', 'int_pflux_30MeV']
+    status_cols = ['status_10', 'status_30']
+
+    eval_data = self.data[eval_cols].to_numpy(dtype=np.float64, copy=True)
+    eval_data[~(self.data[status_cols].to_numpy() <= max_status)] = np.nan
+    self.data[eval_cols] = eval_data
 
     # Remove lines without any good data
-    good_cols = (np.isfinite(self.data.loc[:, eval_cols])).sum(axis=1)
-    bad_index = good_cols[good_cols == 0].index
-    self.data = self.data.drop(index=bad_index)
+    self.data = self.data[np.isfinite(eval_data).any(axis=1)]
 
     return
 
@@ -133,7 +160,7 @@ def clean(self):
 # ----------------------------------------------------------------------------
 # Instrument functions
 
-download = functools.partial(mm_ace.download, name=name, now=now)
+download = functools.partial(mm_ace.download, name=name)
 list_files = functools.partial(mm_ace.list_files, name=name)
 
 
@@ -158,7 +185,7 @@ def load(fnames, tag='', inst_id=''):
 
     See Also
     --------
-    pysat.instruments.methods.general.load_csv_data
+    pysatSpaceWeather.instruments.methods.general.load_csv_data
 
     Note
     ----
@@ -167,48 +194,12 @@ def load(fnames, tag='', inst_id=''):
     """
 
     # Save each file to the output DataFrame
-    data = load_csv_data(fnames, read_csv_kwargs={'index_col': 0,
-                                                  'parse_dates': True})
+    data = general.load_csv_data(fnames, read_csv_kwargs=_read_csv_kwargs)
+    data = mm_ace.convert_index_unit(data)
+    data = mm_ace.convert_status_dtype(data)
 
     # Assign the meta data
-    meta, status_desc = mm_ace.common_metadata()
-    flux_name = 'Integral Proton Flux'
-
-    meta['status_10'] = {meta.labels.units: '',
-                         meta.labels.name: ''.join([flux_name,
-                                                    ' > 10 MeV Status']),
-                         meta.labels.notes: '',
-                         meta.labels.desc: status_desc,
-                         meta.labels.fill_val: np.nan,
-                         meta.labels.min_val: 0,
-                         meta.labels.max_val: 9}
-    meta['status_30'] = {meta.labels.units: '',
-                         meta.labels.name: ''.join([flux_name,
-                                                    ' > 30 MeV Status']),
-                         meta.labels.notes: '',
-                         meta.labels.desc: status_desc,
-                         meta.labels.fill_val: np.nan,
-                         meta.labels.min_val: 0,
-                         meta.labels.max_val: 9}
-    meta['int_pflux_10MeV'] = {meta.labels.units: 'p/cs2-sec-ster',
-                               meta.labels.name: ''.join([flux_name,
-                                                          ' > 10 MeV']),
-                               meta.labels.notes: '',
-                               meta.labels.desc: ''.join(['5-min averaged ',
-                                                          flux_name,
-                                                          ' > 10 MeV']),
-                               meta.labels.fill_val: -1.0e5,
-                               meta.labels.min_val: -np.inf,
-                               meta.labels.max_val: np.inf}
-    meta['int_pflux_30MeV'] = {meta.labels.units: 'p/cs2-sec-ster',
-                               meta.labels.name: ''.join([flux_name,
-                                                          ' > 30 MeV']),
-                               meta.labels.notes: '',
-                               meta.labels.desc: ''.join(['5-min averaged ',
-                                                          flux_name,
-                                                          ' > 30 MeV']),
-                               meta.labels.fill_val: -1.0e5,
-                               meta.labels.min_val: -np.inf,
-                               meta.labels.max_val: np.inf}
+    meta, _ = mm_ace.common_metadata()
+    mm_ace.update_metadata(meta, _var_meta)
 
     return data, meta
@@ -51,7 +51,6 @@ import datetime as dt
 import functools
 import numpy as np
 
-from pysat.instruments.methods.general import load_csv_data
 from pysat import logger
 
 from pysatSpaceWeather.instruments.methods import ace as mm_ace
@@ -64,9 +63,31 @@ platform = 'ace'
 name = 'swepam'
 tags = {'realtime': 'Real-time data from the SWPC',
         'historic': ' Historic data from the SWPC'}
-inst_ids = {inst_id: [tag for tag in tags.keys()] for inst_id in ['']}
-
-# Define today's date
+inst_ids = {'': list(tags.keys())}
+
+# Define the metadata for each data variable, keyed by the `pysat.MetaLabels`
+# attribute names
+_sw_desc = '1-min averaged Solar Wind '
+_var_meta = {
+    'status': {'units': '', 'name': 'Status', 'notes': '',
+               'desc': mm_ace.status_desc,
+               'fill_val': mm_ace.status_fill, 'min_val': 0, 'max_val': 9},
+    'sw_proton_dens': {'units': 'p/cc', 'name': 'Solar Wind Proton Density',
+                       'notes': '',
+                       'desc': ''.join([_sw_desc, 'Proton Density']),
+                       'fill_val': -9999.9, 'min_val': 0.0, 'max_val': np.inf},
+    'sw_bulk_speed': {'units': 'km/s', 'name': 'Solar Wind Bulk Speed',
+                      'notes': '', 'desc': ''.join([_sw_desc, 'Bulk Speed']),
+                      'fill_val': -9999.9, 'min_val': -np.inf,
+                      'max_val': np.inf},
+    'sw_ion_temp': {'units': 'K', 'name': 'Solar Wind Ti', 'notes': '',
+                    'desc': ''.join([_sw_desc, 'Ion Temperature']),
+                    'fill_val': -1.0e5, 'min_val': 0.0, 'max_val': np.inf}}
+
+# Define the file loading kwargs, including the data types of each column
+_read_csv_kwargs = mm_ace.get_read_csv_kwargs(_var_meta)
+
+# Define today's date for the test attributes
 now = dt.datetime.now(tz=dt.timezone.utc)
 
 # ----------------------------------------------------------------------------
@@ -113,7 +134,7 @@ def clean(self):
     max_status = mm_ace.clean(self)
 
     # Replace bad values with NaN and remove times with no valid data
-    self.data = self.data[self.data['status'] <= max_status]
+    self.data = self.data[self.data['status'].to_numpy() <= max_status]
 
     return
 
@@ -121,7 +142,7 @@ def clean(self):
 # ----------------------------------------------------------------------------
 # Instrument functions
 
-download = functools.partial(mm_ace.download, name=name, now=now)
+download = functools.partial(mm_ace.download, name=name)
 list_files = functools.partial(mm_ace.list_files, name=name)
 
 
@@ -146,7 +167,7 @@ def load(fnames, tag='', inst_id=''):
 
     See Also
     --------
-    pysat.instruments.methods.general.load_csv_data
+    pysatSpaceWeather.instruments.methods.general.load_csv_data
 
     Note
     ----
@@ -155,43 +176,12 @@ def load(fnames, tag='', inst_id=''):
     """
 
     # Save each file to the output DataFrame
-    data = load_csv_data(fnames, read_csv_kwargs={'index_col': 0,
-                                                  'parse_dates': True})
+    data = general.load_csv_data(fnames, read_csv_kwargs=_read_csv_kwargs)
+    data = mm_ace.convert_index_unit(data)
+    data = mm_ace.convert_status_dtype(data)
 
     # Assign the meta data
-    meta, status_desc = mm_ace.common_metadata()
-    sw_desc = '1-min averaged Solar Wind '
-
-    meta['status'] = {meta.labels.units: '',
-                      meta.labels.name: 'Status',
-                      meta.labels.notes: '',
-                      meta.labels.desc: status_desc,
-                      meta.labels.fill_val: np.nan,
-                      meta.labels.min_val: 0,
-                      meta.labels.max_val: 9}
-    meta['sw_proton_dens'] = {meta.labels.units: 'p/cc',
-                              meta.labels.name: 'Solar Wind Proton Density',
-                              meta.labels.notes: '',
-                              meta.labels.desc: ''.join([sw_desc,
-                                                         'Proton Density']),
-                              meta.labels.fill_val: -9999.9,
-                              meta.labels.min_val: 0.0,
-                              meta.labels.max_val: np.inf}
-    meta['sw_bulk_speed'] = {meta.labels.units: 'km/s',
-                             meta.labels.name: 'Solar Wind Bulk Speed',
-                             meta.labels.notes: '',
-                             meta.labels.desc: ''.join([sw_desc,
-                                                        'Bulk Speed']),
-                             meta.labels.fill_val: -9999.9,
-                             meta.labels.min_val: -np.inf,
-                             meta.labels.max_val: np.inf}
-    meta['sw_ion_temp'] = {meta.labels.units: 'K',
-                           meta.labels.name: 'Solar Wind Ti',
-                           meta.labels.notes: '',
-                           meta.labels.desc: ''.join([sw_desc,
-                                                      'Ion Temperature']),
-                           meta.labels.fill_val: -1.0e5,
-                           meta.labels.min_val: 0.0,
-                           meta.labels.max_val: np.inf}
+    meta, _ = mm_ace.common_metadata()
+    mm_ace.update_metadata(meta, _var_meta)
 
     return data, meta
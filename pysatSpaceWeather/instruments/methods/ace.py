@@ -9,20 +9,92 @@
 # ----------------------------------------------------------------------------
 """Provides general routines for the ACE space weather instruments."""
 
+from concurrent import futures
 import datetime as dt
+import functools
 import numpy as np
 import os
+from packaging import version
 import pandas as pds
+import re
+import time
 
 import pysat
 
 from pysatSpaceWeather.instruments.methods import general
 
+# The pyarrow CSV parser is only supported by pandas 1.4 and later
+csv_engine = 'c'
+if version.Version(pds.__version__) >= version.Version('1.4.0'):
+    try:
+        import pyarrow  # noqa F401
+        csv_engine = 'pyarrow'
+    except ImportError:
+        pass
+
 logger = pysat.logger
 clean_warn = {'dusty': [('logger', 'WARN',
                          "unused clean level 'dusty', reverting to 'clean'",
                          'clean')]}
 
+# Define the kwargs used to read the local ACE files, using the multithreaded
+# pyarrow CSV parser when it is available
+read_csv_kwargs = {'index_col': 0, 'parse_dates': True, 'engine': csv_engine}
+
+# Define the time resolution of the loaded index, which is the resolution given
+# by the default pandas parser.  The pyarrow parser keeps the file resolution.
+# pandas versions before 2.0 only support nanosecond resolution, and so the
+# unit is not set
+index_unit = getattr(pds.to_datetime(['2000-01-01 00:00:00']), 'unit', None)
+
+# Define the update cadence of the real-time files in seconds
+realtime_cadence = 60
+
+# Provide information about the status flags, which are stored as small
+# integers and use the 'no data' flag as the fill value
+status_desc = '0 = nominal data, 1 to 8 = bad data record, 9 = no data'
+status_dtype = np.int8
+status_fill = 9
+
+# Define the metadata for the Julian day and seconds of day, keyed by the
+# `pysat.MetaLabels` attribute names
+common_var_meta = {'jd': {'units': 'days', 'name': 'MJD', 'notes': '',
+                          'desc': 'Modified Julian Day', 'fill_val': np.nan,
+                          'min_val': -np.inf, 'max_val': np.inf},
+                   'sec': {'units': 's', 'name': 'Sec of Day', 'notes': '',
+                           'desc': 'Seconds of Julian Day', 'fill_val': np.nan,
+                           'min_val': -np.inf, 'max_val': np.inf}}
+
+
+# Define the acknowledgements and references for the ACE instruments
+ackn = ''.join(['NOAA provided funds for the modification of ',
+                ' the ACE transmitter to enable the broadcast of',
+                ' the real-time data and also funds to the ',
+                'instrument teams to provide the algorithms for ',
+                'processing the real-time data.'])
+
+refs = {'mag': "".join(["'The ACE Magnetic Field Experiment', ",
+                        "C. W. Smith, M. H. Acuna, L. F. Burlaga, ",
+                        "J. L'Heureux, N. F. Ness and J. Scheifele, ",
+                        "Space Sci. Rev., 86, 613-632 (1998)."]),
+        'epam': ''.join(['Gold, R. E., S. M. Krimigis, S. E. Hawkins, ',
+                         'D. K. Haggerty, D. A. Lohr, E. Fiore, ',
+                         'T. P. Armstrong, G. Holland, L. J. Lanzerotti,',
+                         ' Electron, Proton and Alpha Monitor on the ',
+                         'Advanced Composition Explorer Spacecraft, ',
+                         'Space Sci. Rev., 86, 541, 1998.']),
+        'swepam': ''.join(['McComas, D., Bame, S., Barker, P. et al. ',
+                           'Solar Wind Electron Proton Alpha Monitor ',
+                           '(SWEPAM) for the Advanced Composition ',
+                           'Explorer. Space Sci. Rev., 86, 563–612',
+                           ' (1998). ',
+                           'https://doi.org/10.1023/A:1005040232597']),
+        'sis': ''.join(['Stone, E., Cohen, C., Cook, W. et al. The ',
+                        'Solar Isotope Spectrometer for the Advanced ',
+                        'Composition Explorer. Space Sci. Rev., 86, ',
+                        '357–408 (1998). ',
+                        'https://doi.org/10.1023/A:1005027929871'])}
+
 
 def acknowledgements():
     """Define the acknowledgements for the specified ACE instrument.
@@ -34,12 +106,6 @@ def acknowledgements():
 
     """
 
-    ackn = ''.join(['NOAA provided funds for the modification of ',
-                    ' the ACE transmitter to enable the broadcast of',
-                    ' the real-time data and also funds to the ',
-                    'instrument teams to provide the algorithms for ',
-                    'processing the real-time data.'])
-
     return ackn
 
 
@@ -58,28 +124,6 @@ def references(name):
 
     """
 
-    refs = {'mag': "".join(["'The ACE Magnetic Field Experiment', ",
-                            "C. W. Smith, M. H. Acuna, L. F. Burlaga, ",
-                            "J. L'Heureux, N. F. Ness and J. Scheifele, ",
-                            "Space Sci. Rev., 86, 613-632 (1998)."]),
-            'epam': ''.join(['Gold, R. E., S. M. Krimigis, S. E. Hawkins, ',
-                             'D. K. Haggerty, D. A. Lohr, E. Fiore, ',
-                             'T. P. Armstrong, G. Holland, L. J. Lanzerotti,',
-                             ' Electron, Proton and Alpha Monitor on the ',
-                             'Advanced Composition Explorer Spacecraft, ',
-                             'Space Sci. Rev., 86, 541, 1998.']),
-            'swepam': ''.join(['McComas, D., Bame, S., Barker, P. et al. ',
-                               'Solar Wind Electron Proton Alpha Monitor ',
-                               '(SWEPAM) for the Advanced Composition ',
-                               'Explorer. Space Sci. Rev., 86, 563–612',
-                               ' (1998). ',
-                               'https://doi.org/10.1023/A:1005040232597']),
-            'sis': ''.join(['Stone, E., Cohen, C., Cook, W. et al. The ',
-                            'Solar Isotope Spectrometer for the Advanced ',
-                            'Composition Explorer. Space Sci. Rev., 86, ',
-                            '357–408 (1998). ',
-                            'https://doi.org/10.1023/A:1005027929871'])}
-
     if name not in refs.keys():
         raise KeyError('unknown ACE instrument, accepts {:}'.format(
             refs.keys()))
@@ -161,7 +205,7 @@ def list_files(name, tag='', inst_id='', data_path='', format_str=None):
 
 
 def download(date_array, name, tag='', inst_id='', data_path='', now=None,
-             mock_download_dir=None):
+             mock_download_dir=None, max_workers=4):
     """Download the requested ACE Space Weather data.
 
     Parameters
@@ -183,6 +227,10 @@ def download(date_array, name, tag='', inst_id='', data_path='', now=None,
         Local directory with downloaded files or None. If not None, will
         process any files with the correct name and date as if they were
         downloaded (default=None)
+    max_workers : int or NoneType
+        Maximum number of threads used to download historic files, if None
+        the `concurrent.futures.ThreadPoolExecutor` default is used. Set to 1
+        to download the files sequentially. (default=4)
 
     Raises
     ------
@@ -235,53 +283,96 @@ def download(date_array, name, tag='', inst_id='', data_path='', now=None,
                  'sis': ['jd', 'sec', 'status_10', 'int_pflux_10MeV',
                          'status_30', 'int_pflux_30MeV']}
 
-    # Cycle through all the dates
-    for dl_date in date_array:
+    # Define the pattern for an expected data line, once the whitespace
+    # separating the columns has been replaced with commas
+    line_pattern = {
+        dname: re.compile(''.join([r'^(\d{4}),(\d{2}),(\d{2}),(\d{2})(\d{2})',
+                                   r'((?:,[^,\s]+){', str(len(dcols)), r'})$']),
+                          flags=re.MULTILINE)
+        for dname, dcols in data_cols.items()}
+
+    def download_date(dl_date, session):
+        """Download, reformat, and write the file for a single date."""
+        data_file = os.path.join(data_path, '{:s}.txt'.format(
+            '_'.join(["ace", name, tag, dl_date.strftime('%Y-%m-%d')])))
+
+        # The real-time files are updated every minute, don't request them
+        # again if the local file was written more recently than that
+        if all([tag == 'realtime', mock_download_dir is None,
+                os.path.isfile(data_file)]):
+            if time.time() - os.path.getmtime(data_file) < realtime_cadence:
+                logger.info(''.join(['Real-time file downloaded less than ',
+                                     '{:d} s ago, '.format(realtime_cadence),
+                                     'not downloading: ', data_file]))
+                return
+
         # Get the file text from the remote or local destination
-        raw_data = general.get_local_or_remote_text(url[tag], mock_download_dir,
-                                                    dl_date.strftime(file_fmt))
+        raw_data = general.get_local_or_remote_text(
+            url[tag], mock_download_dir, dl_date.strftime(file_fmt),
+            session=session)
 
         if raw_data is None:
-            pysat.logger.info("".join(["Data not downloaded for ",
-                                       dl_date.strftime(file_fmt), ", date may",
-                                       " be out of range for the database or ",
-                                       "data may have been saved to an ",
-                                       "unexpected filename. Check URL: ",
-                                       url[tag], ", or directory: ",
-                                       repr(mock_download_dir)]))
+            pysat.logger.info("".join([
+                "Data not downloaded for ", dl_date.strftime(file_fmt),
+                ", date may be out of range for the database or data may",
+                " have been saved to an unexpected filename. Check URL: ",
+                url[tag], ", or directory: ", repr(mock_download_dir)]))
         else:
-            # Split the file at the last header line and the new line markers
+            # Split the file at the last header line, removing the rest
+            # of that line
             raw_data = raw_data.split('#-----------------')[-1]
-            raw_data = raw_data.split('\n')[1:]  # Remove the last header line
-
-            # Parse the file, treating the 4 time columns separately
-            data_dict = {col: list() for col in data_cols[name]}
-            times = list()
-            nsplit = len(data_cols[name]) + 4
-            for raw_line in raw_data:
-                split_line = raw_line.split()
-                if len(split_line) == nsplit:
-                    times.append(dt.datetime.strptime(
-                        ' '.join(split_line[:4]), '%Y %m %d %H%M'))
-                    for i, col in enumerate(data_cols[name]):
-                        # Convert to a number and save
-                        #
-                        # Output is saved as a float, so don't bother to
-                        # differentiate between int and float
-                        data_dict[col].append(float(split_line[4 + i]))
-                else:
-                    if len(split_line) > 0:
-                        raise IOError(''.join([
-                            'unexpected line encoutered in ', url[tag], "/",
-                            dl_date.strftime(file_fmt), ":\n", raw_line]))
-
-            # Put data into nicer DataFrame
-            data = pds.DataFrame(data_dict, index=times)
+            raw_data = raw_data.split('\n', 1)[-1]
+
+            # Reformat the file text as CSV, combining the 4 time columns
+            # into a single timestamp. The data columns are written as
+            # provided, since they are cast to float when loaded
+            raw_data = re.sub(r'^[ \t\r]+|[ \t\r]+$', '', raw_data,
+                              flags=re.MULTILINE)
+            raw_data = re.sub(r'[ \t]+', ',', raw_data)
+            csv_data, nlines = line_pattern[name].subn(
+                r'\1-\2-\3 \4:\5:00\6', raw_data)
+
+            # Any non-empty lines that were not reformatted are unexpected,
+            # identify the first using the same pattern as the substitution
+            csv_data = re.sub(r'\n{2,}', '\n', csv_data).strip('\n')
+            csv_lines = csv_data.split('\n') if len(csv_data) > 0 else []
+            if nlines != len(csv_lines):
+                bad_line = next((line for line in raw_data.split('\n')
+                                 if len(line) > 0
+                                 and line_pattern[name].match(line) is None),
+                                '')
+                raise IOError(''.join([
+                    'unexpected line encoutered in ', url[tag], "/",
+                    dl_date.strftime(file_fmt), ":\n",
+                    bad_line.replace(',', ' ')]))
 
             # Write out as a file
-            data_file = '{:s}.txt'.format(
-                '_'.join(["ace", name, tag, dl_date.strftime('%Y-%m-%d')]))
-            data.to_csv(os.path.join(data_path, data_file), header=True)
+            with open(data_file, 'w') as fout:
+                fout.write(','.join([''] + data_cols[name]))
+                fout.write('\n')
+                if nlines > 0:
+                    fout.write(csv_data)
+                    fout.write('\n')
+        return
+
+    # Cycle through all the dates, reusing the server connection. The
+    # historic files are independent, so they may be downloaded concurrently
+    concurrent = tag == 'historic' and len(date_array) > 1 and max_workers != 1
+
+    # Keep a pooled connection for each thread, the executor uses at most 32
+    # threads by default
+    pool_maxsize = 32 if max_workers is None else max(max_workers, 1)
+
+    with general.new_remote_session(pool_maxsize=pool_maxsize) as session:
+        if concurrent:
+            with futures.ThreadPoolExecutor(
+                    max_workers=max_workers) as executor:
+                list(executor.map(functools.partial(download_date,
+                                                    session=session),
+                                  date_array))
+        else:
+            for dl_date in date_array:
+                download_date(dl_date, session)
 
     return
 
@@ -297,33 +388,126 @@ def common_metadata():
         Description of the status flags
 
     """
-    # Initialize the metadata
+    # Initialize the metadata, defining the Julian day and seconds of day
     meta = pysat.Meta()
-
-    # Define the Julian day
-    meta['jd'] = {meta.labels.units: 'days',
-                  meta.labels.name: 'MJD',
-                  meta.labels.notes: '',
-                  meta.labels.desc: 'Modified Julian Day',
-                  meta.labels.fill_val: np.nan,
-                  meta.labels.min_val: -np.inf,
-                  meta.labels.max_val: np.inf}
-
-    # Define the seconds of day
-    meta['sec'] = {meta.labels.units: 's',
-                   meta.labels.name: 'Sec of Day',
-                   meta.labels.notes: '',
-                   meta.labels.desc: 'Seconds of Julian Day',
-                   meta.labels.fill_val: np.nan,
-                   meta.labels.min_val: -np.inf,
-                   meta.labels.max_val: np.inf}
-
-    # Provide information about the status flags
-    status_desc = '0 = nominal data, 1 to 8 = bad data record, 9 = no data'
+    update_metadata(meta, common_var_meta)
 
     return meta, status_desc
 
 
+def get_read_csv_kwargs(var_meta):
+    """Get the `pds.read_csv` kwargs for loading local ACE files.
+
+    Parameters
+    ----------
+    var_meta : dict
+        Dict with the instrument data variable names as keys, excluding the
+        common 'jd' and 'sec' variables
+
+    Returns
+    -------
+    csv_kwargs : dict
+        Dict of kwargs for `pds.read_csv`, which specifies the data type of
+        every data column so that it does not need to be inferred
+
+    Note
+    ----
+    All ACE data values are written as floats by `download`, so all data
+    columns are read as 64-bit floats to preserve the fill values.
+
+    """
+
+    csv_kwargs = dict(read_csv_kwargs)
+    csv_kwargs['dtype'] = {var: np.float64 for var
+                           in list(common_var_meta.keys())
+                           + list(var_meta.keys())}
+
+    return csv_kwargs
+
+
+def convert_status_dtype(data):
+    """Convert the ACE status flags to the status data type.
+
+    Parameters
+    ----------
+    data : pds.DataFrame
+        ACE data loaded from file, with the status flags stored as floats
+
+    Returns
+    -------
+    data : pds.DataFrame
+        ACE data with the status flags stored as `status_dtype`
+
+    Note
+    ----
+    Status flags are read as floats, since files written by older versions of
+    `download` store them as floats.
+
+    """
+
+    status_cols = [col for col in data.columns if col.startswith('status')]
+    data = data.astype({col: status_dtype for col in status_cols})
+
+    return data
+
+
+def convert_index_unit(data):
+    """Convert the time index of loaded ACE data to the `index_unit` resolution.
+
+    Parameters
+    ----------
+    data : pds.DataFrame
+        ACE data loaded from file
+
+    Returns
+    -------
+    data : pds.DataFrame
+        ACE data with a time index of `index_unit` resolution
+
+    Note
+    ----
+    Ensures the index type does not depend on the CSV parser used to load the
+    data.  Data is returned unchanged if `index_unit` is None, as is the case
+    for pandas versions that only support nanosecond resolution.
+
+    """
+
+    if index_unit is not None and isinstance(data.index, pds.DatetimeIndex):
+        data.index = data.index.as_unit(index_unit)
+
+    return data
+
+
+def update_metadata(meta, var_meta):
+    """Assign metadata for ACE data variables.
+
+    Parameters
+    ----------
+    meta : pysat.Meta
+        pysat Meta class to be updated in place
+    var_meta : dict
+        Dict with data variable names as keys and dicts of metadata as values.
+        The metadata dicts are keyed by `pysat.MetaLabels` attribute names
+        (e.g., 'units', 'fill_val'), so that they may be defined once for any
+        set of metadata labels.
+
+    """
+
+    # Group the variables by the metadata they define, so that each group
+    # may be assigned at once
+    var_groups = dict()
+    for var, var_dict in var_meta.items():
+        var_groups.setdefault(tuple(var_dict.keys()), list()).append(var)
+
+    labels = meta.labels
+    for lkeys, gvars in var_groups.items():
+        meta[gvars] = {getattr(labels, lkey): [var_meta[var][lkey]
+                                               for var in gvars]
+                       for lkey in lkeys}
+
+    return
+
+
 def ace_swepam_hourly_omni_norm(as_inst, speed_key='sw_bulk_speed',
                                 dens_key='sw_proton_dens',
                                 temp_key='sw_ion_temp'):
@@ -354,41 +538,47 @@ def ace_swepam_hourly_omni_norm(as_inst, speed_key='sw_bulk_speed',
         if var not in as_inst.variables:
             raise ValueError('instrument missing variable: {:}'.format(var))
 
-    # Let yt be the fractional years since 1998.0
-    yt = np.array([pysat.utils.time.datetime_to_dec_year(itime) - 1998.0
-                   for itime in as_inst.index])
+    # Let yt be the fractional years since 1998.0, calculated as in
+    # `pysat.utils.time.datetime_to_dec_year` for all times at once
+    itimes = pds.DatetimeIndex(as_inst.index)
+    day = itimes.dayofyear.to_numpy(dtype=np.float64) - 1.0
+    day += (itimes.hour.to_numpy(dtype=np.float64)
+            + (itimes.minute.to_numpy(dtype=np.float64)
+               + (itimes.second.to_numpy(dtype=np.float64)
+                  + itimes.microsecond.to_numpy(dtype=np.float64) * 1.0e-6)
+               / 60.0) / 60.0) / 24.0
+    yt = itimes.year.to_numpy(dtype=np.float64) + day / np.where(
+        itimes.is_leap_year, 366.0, 365.0) - 1998.0
 
     # The normalization depends on the year
     yt_dens = (yt >= 2019.0) & (yt <= 2021.0)
     yt_temp = (yt >= 2019.0) & (yt <= 2020.0)
 
-    # Get the masks for the different velocity limits
-    ilow = as_inst[speed_key] < 395
-    imid = (as_inst[speed_key] >= 395) & (as_inst[speed_key] <= 405)
-    ihigh = as_inst[speed_key] > 405
-
-    # Calculate the normalized plasma density
-    norm_n = np.array(as_inst[dens_key])
-    norm_n[ilow] *= (0.925 + 0.0039 * yt[ilow])
-    norm_n[imid] *= (74.02 - 0.164 * as_inst[speed_key][imid]
-                     + 0.0171 * as_inst[speed_key][imid] * yt[imid]
-                     - 6.72 * yt[imid]) / 10.0
-    norm_n[ihigh] *= (0.761 + 0.0210 * yt[ihigh])
-
-    # Overwrite the calculation for the year where velocity isn't important
-    norm_n[yt_dens] = np.power(10.0, -0.010 + 1.006
-                               * np.log10(as_inst[dens_key][yt_dens]))
+    # Get the data as arrays
+    speed = as_inst[speed_key].to_numpy(dtype=np.float64)
+    dens = as_inst[dens_key].to_numpy(dtype=np.float64)
+    temp = as_inst[temp_key].to_numpy(dtype=np.float64)
+
+    # Calculate the normalized plasma density in a single pass, the
+    # velocity isn't important for some years and is used to select the
+    # normalization for the rest
+    log_dens = np.log10(dens, out=np.full(dens.shape, np.nan), where=yt_dens)
+    norm_n = np.select(
+        [yt_dens, speed < 395, speed <= 405, speed > 405],
+        [np.power(10.0, -0.010 + 1.006 * log_dens),
+         dens * (0.925 + 0.0039 * yt),
+         dens * ((74.02 - 0.164 * speed + 0.0171 * speed * yt - 6.72 * yt)
+                 / 10.0),
+         dens * (0.761 + 0.0210 * yt)], default=dens)
 
     # Normalize the temperature
-    norm_t = np.array(as_inst[temp_key])
-    norm_t[~yt_temp] = np.power(10.0,
-                                -0.069 + 1.024 * np.log10(norm_t[~yt_temp]))
-    norm_t[yt_temp] = np.power(10.0,
-                               0.266 + 0.947 * np.log10(norm_t[yt_temp]))
+    log_temp = np.log10(temp)
+    norm_t = np.where(yt_temp, np.power(10.0, 0.266 + 0.947 * log_temp),
+                      np.power(10.0, -0.069 + 1.024 * log_temp))
 
     # Update the instrument data
-    as_inst['sw_proton_dens_norm'] = pds.Series(norm_n, index=as_inst.index)
-    as_inst['sw_ion_temp_norm'] = pds.Series(norm_t, index=as_inst.index)
+    as_inst['sw_proton_dens_norm'] = norm_n
+    as_inst['sw_ion_temp_norm'] = norm_t
 
     # Add meta data
     for dkey in [dens_key, temp_key]:
@@ -9,6 +9,29 @@
 # ----------------------------------------------------------------------------
 """Provides support routines for auroral electrojet indices."""
 
+# Define the acknowledgements for each tag, formatted with the index name
+ackn = {'lasp': ''.join(['Preliminary {:s} predictions are provided by LASP, ',
+                         'contact Xinlin Li for more details ',
+                         '<xinlin.li@lasp.colorado.edu>'])}
+
+# Define the references for each tag and index name
+_davis = ''.join(['Davis, T. N., and Sugiura, M. (1966), Auroral electrojet',
+                  ' activity index AE and its universal time variations, ',
+                  'J. Geophys. Res., 71( 3), 785– 801, ',
+                  'doi:10.1029/JZ071i003p00785.'])
+_luo_au_al_ae = ''.join(['Luo, B., Li, X., Temerin, M., and Liu, S. (2013),',
+                         'Prediction of the AU, AL, and AE indices using ',
+                         'solar wind parameters, J. Geophys. Res. Space ',
+                         'Physics, 118, 7683– 7694, ',
+                         'doi:10.1002/2013JA019188.'])
+_li_al = ''.join(['Li, X., Oh, K. S., and Temerin, M. (2007), Prediction ',
+                  'of the AL index using solar wind parameters, J. ',
+                  'Geophys. Res., 112, A06224, doi:10.1029/2006JA011918.'])
+
+refs = {'lasp': {'ae': '\n'.join([_davis, _luo_au_al_ae]),
+                 'au': '\n'.join([_davis, _luo_au_al_ae]),
+                 'al': '\n'.join([_davis, _li_al, _luo_au_al_ae])}}
+
 
 def acknowledgements(name, tag):
     """Define the acknowledgements for the index and data source.
@@ -28,11 +51,7 @@ def acknowledgements(name, tag):
 
     """
 
-    ackn = {'lasp': ''.join(['Preliminary ', name.upper(), ' predictions are ',
-                             'provided by LASP, contact Xinlin Li for more ',
-                             'details <xinlin.li@lasp.colorado.edu>'])}
-
-    return ackn[tag]
+    return ackn[tag].format(name.upper())
 
 
 def references(name, tag):
@@ -52,22 +71,4 @@ def references(name, tag):
 
     """
 
-    davis = ''.join(['Davis, T. N., and Sugiura, M. (1966), Auroral electrojet',
-                     ' activity index AE and its universal time variations, ',
-                     'J. Geophys. Res., 71( 3), 785– 801, ',
-                     'doi:10.1029/JZ071i003p00785.'])
-
-    luo_au_al_ae = ''.join(['Luo, B., Li, X., Temerin, M., and Liu, S. (2013),',
-                            'Prediction of the AU, AL, and AE indices using ',
-                            'solar wind parameters, J. Geophys. Res. Space ',
-                            'Physics, 118, 7683– 7694, ',
-                            'doi:10.1002/2013JA019188.'])
-    li_al = ''.join(['Li, X., Oh, K. S., and Temerin, M. (2007), Prediction ',
-                     'of the AL index using solar wind parameters, J. ',
-                     'Geophys. Res., 112, A06224, doi:10.1029/2006JA011918.'])
-
-    refs = {'lasp': {'ae': '\n'.join([davis, luo_au_al_ae]),
-                     'au': '\n'.join([davis, luo_au_al_ae]),
-                     'al': '\n'.join([davis, li_al, luo_au_al_ae])}}
-
     return refs[tag][name]
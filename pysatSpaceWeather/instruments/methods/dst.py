@@ -9,6 +9,22 @@
 # ----------------------------------------------------------------------------
 """Provides default routines for Dst."""
 
+# Define the acknowledgements and references for each Dst tag
+ackn = {'noaa': 'Dst is maintained at NCEI (formerly NGDC) at NOAA',
+        'lasp': ''.join(['Preliminary Dst predictions are provided by ',
+                         'LASP, contact Xinlin Li for more details ',
+                         '<xinlin.li@lasp.colorado.edu>'])}
+
+refs = {'noaa': ''.join(['See referenece list and publication at: ',
+                         'Sugiura M. and T. Kamei, http://',
+                         'wdc.kugi.kyoto-u.ac.jp/dstdir/dst2/',
+                         'onDstindex.html, last updated June 1991, ',
+                         'accessed Dec 2020']),
+        'lasp': ''.join(['A New Model for the Prediction of Dst on the ',
+                         'Basis of the Solar Wind [Temerin and Li, 2002] ',
+                         'and Dst model for 1995-2002 [Temerin and Li, ',
+                         '2006]'])}
+
 
 def acknowledgements(tag):
     """Define the acknowledgements for the Dst data.
@@ -25,11 +41,6 @@ def acknowledgements(tag):
 
     """
 
-    ackn = {'noaa': 'Dst is maintained at NCEI (formerly NGDC) at NOAA',
-            'lasp': ''.join(['Preliminary Dst predictions are provided by ',
-                             'LASP, contact Xinlin Li for more details ',
-                             '<xinlin.li@lasp.colorado.edu>'])}
-
     return ackn[tag]
 
 
@@ -48,14 +59,4 @@ def references(tag):
 
     """
 
-    refs = {'noaa': ''.join(['See referenece list and publication at: ',
-                             'Sugiura M. and T. Kamei, http://',
-                             'wdc.kugi.kyoto-u.ac.jp/dstdir/dst2/',
-                             'onDstindex.html, last updated June 1991, ',
-                             'accessed Dec 2020']),
-            'lasp': ''.join(['A New Model for the Prediction of Dst on the ',
-                             'Basis of the Solar Wind [Temerin and Li, 2002] ',
-                             'and Dst model for 1995-2002 [Temerin and Li, ',
-                             '2006]'])}
-
     return refs[tag]
@@ -18,6 +18,40 @@ import pysat
 
 import pysatSpaceWeather as pysat_sw
 from pysatSpaceWeather.instruments.methods.general import is_fill_val
+from pysatSpaceWeather.instruments.methods import gfz
+
+
+# Define the acknowledgements and references for each F10.7 tag
+_lisird_ackn = 'NOAA radio flux obtained through LISIRD'
+_swpc_ackn = ''.join(['Prepared by the U.S. Dept. of Commerce, NOAA, Space ',
+                      'Weather Prediction Center'])
+
+ackn = {'historic': _lisird_ackn, 'prelim': _swpc_ackn, 'daily': _swpc_ackn,
+        'forecast': _swpc_ackn, '45day': _swpc_ackn, 'now': gfz.ackn}
+
+_noaa_desc = ''.join(['Dataset description: ',
+                      'https://www.ngdc.noaa.gov/stp/space-weather/',
+                      'solar-data/solar-features/solar-radio/noontime-flux',
+                      '/penticton/documentation/dataset-description',
+                      '_penticton.pdf, accessed Dec 2020'])
+_orig_ref = ''.join(["Covington, A.E. (1948), Solar noise observations on",
+                     " 10.7 centimetersSolar noise observations on 10.7 ",
+                     "centimeters, Proceedings of the IRE, 36(44), ",
+                     "p 454-457."])
+_swpc_desc = ''.join(['Dataset description: https://www.swpc.noaa.gov/',
+                      'sites/default/files/images/u2/Usr_guide.pdf'])
+_gfz_desc = ''.join(['Dataset description: https://kp.gfz-potsdam.de/app/',
+                     'format/Kp_ap_Ap_SN_F107_format.txt'])
+
+refs = {'historic': "\n".join([_noaa_desc, _orig_ref]),
+        'prelim': "\n".join([_swpc_desc, _orig_ref]),
+        'now': "\n".join([_gfz_desc, _orig_ref]),
+        'daily': "\n".join([_swpc_desc, _orig_ref]),
+        'forecast': "\n".join([_swpc_desc, _orig_ref]),
+        '45day': "\n".join([_swpc_desc, _orig_ref])}
+
+# Time step between daily F10.7 values
+_one_day = pds.Timedelta(days=1)
 
 
 def acknowledgements(tag):
@@ -34,14 +68,6 @@ def acknowledgements(tag):
         Acknowledgements string associated with the appropriate F10.7 tag.
 
     """
-    lisird = 'NOAA radio flux obtained through LISIRD'
-    swpc = ''.join(['Prepared by the U.S. Dept. of Commerce, NOAA, Space ',
-                    'Weather Prediction Center'])
-
-    ackn = {'historic': lisird, 'prelim': swpc, 'daily': swpc,
-            'forecast': swpc, '45day': swpc,
-            'now': pysat_sw.instruments.methods.gfz.ackn}
-
     return ackn[tag]
 
 
@@ -59,27 +85,6 @@ def references(tag):
         Reference string associated with the appropriate F10.7 tag.
 
     """
-    noaa_desc = ''.join(['Dataset description: ',
-                         'https://www.ngdc.noaa.gov/stp/space-weather/',
-                         'solar-data/solar-features/solar-radio/noontime-flux',
-                         '/penticton/documentation/dataset-description',
-                         '_penticton.pdf, accessed Dec 2020'])
-    orig_ref = ''.join(["Covington, A.E. (1948), Solar noise observations on",
-                        " 10.7 centimetersSolar noise observations on 10.7 ",
-                        "centimeters, Proceedings of the IRE, 36(44), ",
-                        "p 454-457."])
-    swpc_desc = ''.join(['Dataset description: https://www.swpc.noaa.gov/',
-                         'sites/default/files/images/u2/Usr_guide.pdf'])
-    gfz_desc = ''.join(['Dataset description: https://kp.gfz-potsdam.de/app/',
-                        'format/Kp_ap_Ap_SN_F107_format.txt'])
-
-    refs = {'historic': "\n".join([noaa_desc, orig_ref]),
-            'prelim': "\n".join([swpc_desc, orig_ref]),
-            'now': "\n".join([gfz_desc, orig_ref]),
-            'daily': "\n".join([swpc_desc, orig_ref]),
-            'forecast': "\n".join([swpc_desc, orig_ref]),
-            '45day': "\n".join([swpc_desc, orig_ref])}
-
     return refs[tag]
 
 
@@ -128,6 +133,8 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
 
     # Initialize metadata and flags
     notes = "Combines data from"
+    noted_standard = False
+    noted_forecast = False
     stag = standard_inst.tag if len(standard_inst.tag) > 0 else 'default'
     tag = 'combined_{:s}_{:s}'.format(stag, forecast_inst.tag)
     inst_flag = 'standard'
@@ -141,7 +148,7 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
     if stop is None:
         stimes = [inst.index.max() for inst in [standard_inst, forecast_inst]
                   if len(inst.index) > 0]
-        stop = max(stimes) + pds.DateOffset(days=1) if len(stimes) > 0 else None
+        stop = max(stimes) + _one_day if len(stimes) > 0 else None
 
     if start is None or stop is None:
         raise ValueError(' '.join(("must either load in Instrument objects or",
@@ -155,19 +162,23 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
     f107_inst.inst_module = pysat_sw.instruments.sw_f107
     f107_inst.tag = tag
     f107_inst.date = start
-    f107_inst.doy = np.int64(start.strftime("%j"))
+    f107_inst.doy = np.int64(start.timetuple().tm_yday)
     fill_val = None
 
-    f107_times = list()
-    f107_values = list()
+    # Save the good times and values from each load, to combine at the end
+    f107_chunks = list()
 
-    # Cycle through the desired time range
+    # Cycle through the desired time range, comparing times as datetime64
     itime = dt.datetime(start.year, start.month, start.day)
+    stop64 = np.datetime64(stop)
+    std_index = standard_inst.index
     while itime < stop and inst_flag is not None:
         # Load and save the standard data for as many times as possible
         if inst_flag == 'standard':
-            # Test to see if data loading is needed
-            if not np.any(standard_inst.index == itime):
+            # Test to see if data loading is needed, using the sorted bounds
+            # of the previously loaded times
+            if (len(std_index) == 0 or itime < std_index[0]
+                    or itime > std_index[-1]):
                 # Set the load kwargs, which vary by pysat version and tag
                 load_kwargs = {'date': itime}
 
@@ -177,33 +188,38 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
 
                 standard_inst.load(**load_kwargs)
 
+            # Retrieve the loaded times once, as Instrument access is slow
+            std_index = standard_inst.index
+
             if standard_inst.empty:
-                good_times = [False]
+                good_times = slice(0, 0)
             else:
-                good_times = ((standard_inst.index >= itime)
-                              & (standard_inst.index < stop))
+                # The loaded times are sorted, so select them with a slice
+                std_times = std_index.to_numpy()
+                good_times = slice(std_times.searchsorted(np.datetime64(itime)),
+                                   std_times.searchsorted(stop64))
 
-            if notes.find("standard") < 0:
+            if not noted_standard:
                 notes += " the {:} source ({:} to ".format(inst_flag,
                                                            itime.date())
+                noted_standard = True
 
-            if np.any(good_times):
+            if good_times.stop > good_times.start:
                 if fill_val is None:
                     f107_inst.meta = standard_inst.meta
                     fill_val = f107_inst.meta['f107'][
                         f107_inst.meta.labels.fill_val]
 
-                good_vals = np.array([not is_fill_val(val, fill_val) for val
-                                      in standard_inst['f107'][good_times]])
-                new_times = list(standard_inst.index[good_times][good_vals])
+                new_vals = standard_inst.data['f107'].to_numpy()[good_times]
+                good_vals = ~is_fill_val(new_vals, fill_val)
+                new_times = std_index[good_times][good_vals]
             else:
                 new_times = []
 
             if len(new_times) > 0:
-                f107_times.extend(new_times)
-                new_vals = list(standard_inst['f107'][good_times][good_vals])
-                f107_values.extend(new_vals)
-                itime = f107_times[-1] + pds.DateOffset(days=1)
+                f107_chunks.append(pds.Series(new_vals[good_vals],
+                                              index=new_times))
+                itime = new_times[-1] + _one_day
             else:
                 inst_flag = 'forecast'
                 notes += "{:})".format(itime.date())
@@ -213,7 +229,8 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
             # Determine which files should be loaded
             if len(forecast_inst.index) == 0:
                 if len(forecast_inst.files.files) > 0:
-                    files = np.unique(forecast_inst.files.files[itime:stop])
+                    files = forecast_inst.files.files.loc[
+                        itime:stop].drop_duplicates().to_numpy()
                 else:
                     files = [None]  # No load, because no files are available
             else:
@@ -222,12 +239,17 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
             # Cycle through all possible files of interest, saving relevant
             # data
             for filename in files:
+                if itime >= stop:
+                    # The desired time range is already covered
+                    break
+
                 if filename is not None:
                     forecast_inst.load(fname=filename)
 
-                if notes.find("forecast") < 0:
+                if not noted_forecast:
                     notes += " the {:} source ({:} to ".format(inst_flag,
                                                                itime.date())
+                    noted_forecast = True
 
                 # Determine which times to save
                 if forecast_inst.empty:
@@ -240,21 +262,22 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
                             f107_inst.meta.labels.fill_val]
 
                     # Get the good times and values
-                    good_times = ((forecast_inst.index >= itime)
-                                  & (forecast_inst.index < stop))
-                    good_vals = np.array([
-                        not is_fill_val(val, fill_val) for val
-                        in forecast_inst['f107'][good_times]])
+                    fcast_index = forecast_inst.index
+                    fcast_times = fcast_index.to_numpy()
+                    good_times = slice(
+                        fcast_times.searchsorted(np.datetime64(itime)),
+                        fcast_times.searchsorted(stop64))
+                    new_vals = forecast_inst.data['f107'].to_numpy()[
+                        good_times]
+                    good_vals = ~is_fill_val(new_vals, fill_val)
 
                 # Save desired data and cycle time
                 if len(good_vals) > 0:
-                    new_times = list(forecast_inst.index[good_times][
-                        good_vals])
-                    f107_times.extend(new_times)
-                    new_vals = list(
-                        forecast_inst['f107'][good_times][good_vals])
-                    f107_values.extend(new_vals)
-                    itime = f107_times[-1] + pds.DateOffset(days=1)
+                    new_times = fcast_index[good_times][good_vals]
+                    if len(new_times) > 0:
+                        f107_chunks.append(pds.Series(new_vals[good_vals],
+                                                      index=new_times))
+                    itime = f107_chunks[-1].index[-1] + _one_day
 
             notes += "{:})".format(itime.date())
 
@@ -263,47 +286,28 @@ def combine_f107(standard_inst, forecast_inst, start=None, stop=None):
     if inst_flag is not None:
         notes += "{:})".format(itime.date())
 
-    # Determine if the beginning or end of the time series needs to be padded
-    if len(f107_times) >= 2:
-        freq = pysat.utils.time.calc_freq(f107_times)
+    # Combine the saved data
+    if len(f107_chunks) > 0:
+        f107_data = pds.concat(f107_chunks)
+    else:
+        f107_data = pds.Series(dtype=np.float64)
+
+    # Determine the output times from the combined data.  All sw_f107
+    # Instruments have a daily cadence, so the frequency need not be inferred
+    if all([inst.platform == 'sw' and inst.name == 'f107'
+            for inst in [standard_inst, forecast_inst]]):
+        freq = "86400s"
+    elif len(f107_data.index) >= 2:
+        freq = pysat.utils.time.calc_freq(f107_data.index)
     else:
         freq = None
-    end_date = stop - pds.DateOffset(days=1)
+    end_date = stop - _one_day
     date_range = pds.date_range(start=start, end=end_date, freq=freq)
 
-    if len(f107_times) == 0:
-        f107_times = date_range
-
-    if date_range[0] < f107_times[0]:
-        # Extend the time and value arrays from their beginning with fill
-        # values
-        itime = abs(date_range - f107_times[0]).argmin()
-        f107_times.reverse()
-        f107_values.reverse()
-        extend_times = list(date_range[:itime])
-        extend_times.reverse()
-        f107_times.extend(extend_times)
-        f107_values.extend([fill_val for kk in extend_times])
-        f107_times.reverse()
-        f107_values.reverse()
-
-    if date_range[-1] > f107_times[-1]:
-        # Extend the time and value arrays from their end with fill values
-        itime = abs(date_range - f107_times[-1]).argmin() + 1
-        extend_times = list(date_range[itime:])
-        f107_times.extend(extend_times)
-        f107_values.extend([fill_val for kk in extend_times])
-
-    # Save output data
-    f107_inst.data = pds.DataFrame(f107_values, columns=['f107'],
-                                   index=f107_times)
-
-    # Resample the output data, filling missing values
-    if (date_range.shape != f107_inst.index.shape
-            or abs(date_range - f107_inst.index).max().total_seconds() > 0.0):
-        f107_inst.data = f107_inst.data.resample(freq).asfreq()
-        if np.isfinite(fill_val):
-            f107_inst.data[np.isnan(f107_inst.data)] = fill_val
+    # Save output data, padding any missing times with fill values
+    f107_inst.data = f107_data.to_frame('f107').reindex(date_range)
+    if fill_val is not None and np.isfinite(fill_val):
+        f107_inst.data = f107_inst.data.fillna(fill_val)
 
     # Update the metadata notes for this procedure
     notes += ", in that order"
@@ -345,29 +349,16 @@ def calc_f107a(f107_inst, f107_name='f107', f107a_name='f107a', min_pnts=41):
     else:
         fill_val = np.nan
 
-    # Calculate the rolling mean.  Since these values are centered but rolling
-    # function doesn't allow temporal windows to be calculated this way, create
-    # a hack for this.
-    #
-    # Ensure the data are evenly sampled at a daily frequency, since this is
-    # how often F10.7 is calculated.
+    # Calculate the rolling mean.  Ensure the data are evenly sampled at a
+    # daily frequency, since this is how often F10.7 is calculated, so that
+    # a centered window of 81 samples spans 81 days.
     f107_fill = f107_inst.data.resample('1D').asfreq()
 
-    # Replace the time index with an ordinal
-    time_ind = f107_fill.index
-    f107_fill['ord'] = pds.Series([tt.toordinal() for tt in time_ind],
-                                  index=time_ind)
-    f107_fill.set_index('ord', inplace=True)
-
     # Calculate the mean
     f107_fill[f107a_name] = f107_fill[f107_name].rolling(window=81,
                                                          min_periods=min_pnts,
                                                          center=True).mean()
 
-    # Replace the ordinal index with the time
-    f107_fill['time'] = pds.Series(time_ind, index=f107_fill.index)
-    f107_fill.set_index('time', inplace=True)
-
     # Resample to the original frequency, if it is not equal to 1 day
     freq = pysat.utils.time.calc_freq(f107_inst.index)
     if freq != "86400s":
@@ -9,13 +9,57 @@
 # ----------------------------------------------------------------------------
 """Provides routines that support general space weather instruments."""
 
+from concurrent import futures
+import functools
 import importlib
 import numpy as np
 import os
+import pandas as pds
 import requests
+from urllib3.util.retry import Retry
 
 import pysat
 
+# ----------------------------------------------------------------------------
+# Define the module variables
+
+# Seconds to wait for a remote server to respond before giving up
+request_timeout = 30
+
+# Retry policy for transient failures of remote requests
+remote_retries = Retry(total=3, backoff_factor=0.5)
+
+# ----------------------------------------------------------------------------
+# Define the module functions
+
+
+def new_remote_session(pool_maxsize=16):
+    """Create a session for remote requests that retries transient failures.
+
+    Parameters
+    ----------
+    pool_maxsize : int
+        Maximum number of connections kept alive for each server, which should
+        be at least the number of threads sharing the session (default=16)
+
+    Returns
+    -------
+    session : requests.Session
+        Session with pooled, retrying HTTPS connections
+
+    """
+    session = requests.Session()
+    session.mount('https://', requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=pool_maxsize,
+        max_retries=remote_retries))
+
+    return session
+
+
+# Session shared by remote text requests, so connections to the same server
+# are kept alive between files and transient failures are retried
+_session = new_remote_session()
+
 
 def is_fill_val(data, fill_val):
     """Evaluate whether or not a value is a fill value.
@@ -59,15 +103,21 @@ def preprocess(inst):
 
     """
 
-    # Replace all fill values with NaN
+    # Find the float fill values that are not already NaN
+    fills = dict()
     for col in inst.variables:
         fill_val = inst.meta[col, inst.meta.labels.fill_val]
 
         # Ensure we are dealing with a float for future nan comparison
         if isinstance(fill_val, np.floating) or isinstance(fill_val, float):
             if ~np.isnan(fill_val):
-                inst.data[col] = inst.data[col].replace(fill_val, np.nan)
-                inst.meta[col] = {inst.meta.labels.fill_val: np.nan}
+                fills[col] = fill_val
+
+    # Replace all fill values with NaN in a single pass
+    if len(fills) > 0:
+        inst.data = inst.data.replace(fills, np.nan)
+        inst.meta[list(fills.keys())] = {
+            inst.meta.labels.fill_val: [np.nan for col in fills.keys()]}
 
     return
 
@@ -91,6 +141,52 @@ def get_instrument_data_path(inst_mod_name, tag='', inst_id='', **kwargs):
     data_path : str
         Path where the Instrument data is stored
 
+    Note
+    ----
+    Results are cached by the inputs and the current pysat data directory
+    parameters, since initializing an Instrument is slow.
+
+    """
+
+    # The pysat parameters that set the data path are included in the cache
+    # key, so that changes to them are respected
+    path_params = (tuple(pysat.params['data_dirs']),
+                   pysat.params['directory_format'])
+
+    try:
+        kwarg_items = frozenset(kwargs.items())
+    except TypeError:
+        # Unhashable kwargs cannot be cached
+        return _get_instrument_data_path.__wrapped__(
+            inst_mod_name, tag, inst_id, path_params, kwargs.items())
+
+    return _get_instrument_data_path(inst_mod_name, tag, inst_id, path_params,
+                                     kwarg_items)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_instrument_data_path(inst_mod_name, tag, inst_id, path_params,
+                              kwarg_items):
+    """Get the `data_path` attribute from an Instrument sub-module.
+
+    Parameters
+    ----------
+    inst_mod_name : str
+        pysatSpaceWeather Instrument module name
+    tag : str
+        String specifying the Instrument tag
+    inst_id : str
+        String specifying the instrument identification
+    path_params : tuple
+        pysat data directories and directory format, used only to key the cache
+    kwarg_items : iterable
+        Key, value pairs of additional kwargs used to initialize an Instrument
+
+    Returns
+    -------
+    data_path : str
+        Path where the Instrument data is stored
+
     """
 
     # Import the desired instrument module by name
@@ -99,7 +195,7 @@ def get_instrument_data_path(inst_mod_name, tag='', inst_id='', **kwargs):
 
     # Initialize a temporary instrument to obtain pysat configuration
     temp_inst = pysat.Instrument(inst_module=inst_mod, tag=tag, inst_id=inst_id,
-                                 **kwargs)
+                                 **dict(kwarg_items))
 
     # Save the data path for this Instrument down to the inst_id level
     data_path = temp_inst.files.data_path
@@ -110,7 +206,7 @@ def get_instrument_data_path(inst_mod_name, tag='', inst_id='', **kwargs):
     return data_path
 
 
-def get_local_or_remote_text(url, mock_download_dir, filename):
+def get_local_or_remote_text(url, mock_download_dir, filename, session=None):
     """Retrieve text from a remote or local file.
 
     Parameters
@@ -123,6 +219,10 @@ def get_local_or_remote_text(url, mock_download_dir, filename):
         Local directory with downloaded files or None. If not None, will
         process any files with the correct name and date as if they were
         downloaded (default=None)
+    session : requests.Session or NoneType
+        Session used to retrieve remote files, allowing the connection to be
+        reused across calls. If None, a module-level session with retries is
+        used. (default=None)
 
     Returns
     -------
@@ -139,9 +239,12 @@ def get_local_or_remote_text(url, mock_download_dir, filename):
     if mock_download_dir is None:
         # Set the download webpage
         furl = ''.join([url, filename])
-        req = requests.get(furl)
+        if session is None:
+            session = _session
+        req = session.get(furl, timeout=request_timeout)
 
-        if req.text.find('not found on this server') > 0:
+        # Search the raw content, since the text is decoded on every access
+        if req.content.find(b'not found on this server') > 0:
             # Ensure useful information about server is passed on to user
             pysat.logger.warning('File {:} not found: {:}'.format(filename,
                                                                   url))
@@ -162,3 +265,61 @@ def get_local_or_remote_text(url, mock_download_dir, filename):
             raw_txt = None
 
     return raw_txt
+
+
+def load_csv_data(fnames, read_csv_kwargs=None, max_workers=None):
+    """Load CSV data from a list of files into a single DataFrame.
+
+    Parameters
+    ----------
+    fnames : array-like
+        Series, list, or array of filenames
+    read_csv_kwargs : dict or NoneType
+        Dict of kwargs to apply to `pds.read_csv`. (default=None)
+    max_workers : int or NoneType
+        Maximum number of threads used to read the files, or None to use the
+        `concurrent.futures.ThreadPoolExecutor` default (default=None)
+
+    Returns
+    -------
+    data : pds.DataFrame
+        Data frame with data from all files in the fnames list
+
+    See Also
+    --------
+    pysat.instruments.methods.general.load_csv_data
+
+    Note
+    ----
+    Matches `pysat.instruments.methods.general.load_csv_data`, but reads
+    multiple files in parallel.  The pandas C parser releases the GIL, so the
+    files are parsed concurrently.
+
+    """
+    # Ensure the filename input is array-like
+    fnames = np.asarray(fnames)
+    if fnames.shape == ():
+        fnames = np.asarray([fnames])
+
+    # Initialize the optional kwargs
+    if read_csv_kwargs is None:
+        read_csv_kwargs = {}
+
+    # Create a list of data frames from each file, retaining the file order
+    if len(fnames) > 1:
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fdata = list(executor.map(
+                lambda fname: pds.read_csv(fname, **read_csv_kwargs), fnames))
+    else:
+        fdata = [pds.read_csv(fname, **read_csv_kwargs) for fname in fnames]
+
+    if len(fdata) == 0:
+        data = pds.DataFrame()
+    else:
+        data = pds.concat(fdata, axis=0)
+
+        # The pyarrow engine names an unlabeled index with an empty string
+        if data.index.name is None or data.index.name == '':
+            data.index.name = "Epoch"
+
+    return data
@@ -24,6 +24,45 @@ from pysatSpaceWeather.instruments.methods import swpc
 # --------------------------------------------------------------------------
 # Instrument utilities
 
+# Define the acknowledgements and references for each index and tag
+ackn = {'kp': {'forecast': swpc.ackn, 'recent': swpc.ackn, 'def': gfz.ackn,
+               'now': gfz.ackn, 'prediction': swpc.ackn},
+        'ap': {'forecast': swpc.ackn, 'recent': swpc.ackn,
+               'prediction': swpc.ackn, '45day': swpc.ackn,
+               'def': gfz.ackn, 'now': gfz.ackn},
+        'cp': {'def': gfz.ackn, 'now': gfz.ackn}}
+
+_gen_refs = "\n".join([''.join(["J. Bartels, The technique of scaling ",
+                                "indices K and Q of geomagnetic activity, ",
+                                "Ann. Intern. Geophys. Year 4, 215-226, ",
+                                "1957."]),
+                       ''.join(["J. Bartels,The geomagnetic measures for ",
+                                "the time-variations of solar corpuscular ",
+                                "radiation, described for use in ",
+                                "correlation studies in other geophysical ",
+                                "fields, Ann. Intern. Geophys. Year 4, ",
+                                "227-236, 1957."]),
+                       ''.join(["P.N. Mayaud, Derivation, Meaning and Use ",
+                                "of Geomagnetic Indices, Geophysical ",
+                                "Monograph 22, Am. Geophys. Union, ",
+                                "Washington D.C., 1980."]),
+                       ''.join(["G.K. Rangarajan, Indices of magnetic ",
+                                "activity, in Geomagnetism, edited by I.A. ",
+                                "Jacobs, Academic, San Diego, 1989."]),
+                       ''.join(["M. Menvielle and A. Berthelier, The ",
+                                "K-derived planetary indices: description ",
+                                "and availability, Rev. Geophys. 29, 3, ",
+                                "415-432, 1991."])])
+
+refs = {'kp': {'forecast': _gen_refs, 'recent': _gen_refs,
+               'prediction': _gen_refs, 'def': gfz.geoind_refs,
+               'now': gfz.geoind_refs},
+        'ap': {'recent': _gen_refs, 'forecast': _gen_refs, '45day': _gen_refs,
+               'prediction': _gen_refs, 'def': gfz.geoind_refs,
+               'now': gfz.geoind_refs},
+        'cp': {'def': gfz.geoind_refs, 'now': gfz.geoind_refs}}
+
+
 def acknowledgements(name, tag):
     """Define the acknowledgements for the geomagnetic data sets.
 
@@ -36,13 +75,6 @@ def acknowledgements(name, tag):
 
     """
 
-    ackn = {'kp': {'forecast': swpc.ackn, 'recent': swpc.ackn, 'def': gfz.ackn,
-                   'now': gfz.ackn, 'prediction': swpc.ackn},
-            'ap': {'forecast': swpc.ackn, 'recent': swpc.ackn,
-                   'prediction': swpc.ackn, '45day': swpc.ackn,
-                   'def': gfz.ackn, 'now': gfz.ackn},
-            'cp': {'def': gfz.ackn, 'now': gfz.ackn}}
-
     return ackn[name][tag]
 
 
@@ -58,36 +90,6 @@ def references(name, tag):
 
     """
 
-    gen_refs = "\n".join([''.join(["J. Bartels, The technique of scaling ",
-                                   "indices K and Q of geomagnetic activity, ",
-                                   "Ann. Intern. Geophys. Year 4, 215-226, ",
-                                   "1957."]),
-                          ''.join(["J. Bartels,The geomagnetic measures for ",
-                                   "the time-variations of solar corpuscular ",
-                                   "radiation, described for use in ",
-                                   "correlation studies in other geophysical ",
-                                   "fields, Ann. Intern. Geophys. Year 4, ",
-                                   "227-236, 1957."]),
-                          ''.join(["P.N. Mayaud, Derivation, Meaning and Use ",
-                                   "of Geomagnetic Indices, Geophysical ",
-                                   "Monograph 22, Am. Geophys. Union, ",
-                                   "Washington D.C., 1980."]),
-                          ''.join(["G.K. Rangarajan, Indices of magnetic ",
-                                   "activity, in Geomagnetism, edited by I.A. ",
-                                   "Jacobs, Academic, San Diego, 1989."]),
-                          ''.join(["M. Menvielle and A. Berthelier, The ",
-                                   "K-derived planetary indices: description ",
-                                   "and availability, Rev. Geophys. 29, 3, ",
-                                   "415-432, 1991."])])
-
-    refs = {'kp': {'forecast': gen_refs, 'recent': gen_refs,
-                   'prediction': gen_refs, 'def': gfz.geoind_refs,
-                   'now': gfz.geoind_refs},
-            'ap': {'recent': gen_refs, 'forecast': gen_refs, '45day': gen_refs,
-                   'prediction': gen_refs, 'def': gfz.geoind_refs,
-                   'now': gfz.geoind_refs},
-            'cp': {'def': gfz.geoind_refs, 'now': gfz.geoind_refs}}
-
     return refs[name][tag]
 
 
@@ -589,7 +591,7 @@ def combine_kp(standard_inst=None, recent_inst=None, forecast_inst=None,
     kp_inst.inst_module = pysat_sw.instruments.sw_kp
     kp_inst.tag = tag
     kp_inst.date = start
-    kp_inst.doy = np.int64(start.strftime("%j"))
+    kp_inst.doy = np.int64(start.timetuple().tm_yday)
     kp_inst.meta = pysat.Meta(**meta_kwargs)
     initialize_kp_metadata(kp_inst.meta, 'Kp', fill_val=fill_val)
 
@@ -54,7 +54,7 @@ def prediction_downloads(name, tag, data_path, mock_download_dir=None):
         req = requests.get(url)
 
         # Test to see if the file was found on the server
-        if req.text.find('not found on this server') > 0:
+        if req.content.find(b'not found on this server') > 0:
             pysat.logger.warning(''.join(['LASP last 96 hour Dst file not ',
                                           'found on server: ', url]))
             raw_txt = None
@@ -23,6 +23,25 @@ ackn = "".join(["LASP Interactive Solar Irradiance Data Center provides ",
                 "LASP and other institutions."])
 
 
+# Define the references for each Instrument
+refs = {'sw': {'mgii': {
+    'composite': {
+        '': ''.join(["Viereck, R. A., Floyd, L. E., Crane, P. C., Woods, ",
+                     "T. N., Knapp, B. G., Rottman, G., Weber, M., Puga,",
+                     " L. C., and DeLand, M. T. (2004), A composite Mg ",
+                     "II index spanning from 1978 to 2003, Space Weather",
+                     ", 2, S10005, doi:10.1029/2004SW000084."])},
+    'sorce': {
+        '': "\n".join([
+            "".join(["Snow, M, William E. McClintock, Thomas N. Woods, ",
+                     "Oran R. White, Jerald W. Harder, and Gary Rottman ",
+                     "(2005). The Mg II Index from SORCE, Solar Phys., ",
+                     "230, 1, 325-344."]),
+            "".join(["Heath, D. and Schlesinger, B. (1986). The Mg 280-nm ",
+                     "doublet as a monitor of changes in solar ",
+                     "ultraviolet irradiance, JGR, 91, 8672-8682."])])}}}}
+
+
 def references(platform, name, tag, inst_id):
     """Provide references for different Instrument data products.
 
@@ -44,23 +63,6 @@ def references(platform, name, tag, inst_id):
 
     """
 
-    refs = {'sw': {'mgii': {
-        'composite': {
-            '': ''.join(["Viereck, R. A., Floyd, L. E., Crane, P. C., Woods, ",
-                         "T. N., Knapp, B. G., Rottman, G., Weber, M., Puga,",
-                         " L. C., and DeLand, M. T. (2004), A composite Mg ",
-                         "II index spanning from 1978 to 2003, Space Weather",
-                         ", 2, S10005, doi:10.1029/2004SW000084."])},
-        'sorce': {
-            '': "\n".join([
-                "".join(["Snow, M, William E. McClintock, Thomas N. Woods, ",
-                         "Oran R. White, Jerald W. Harder, and Gary Rottman ",
-                         "(2005). The Mg II Index from SORCE, Solar Phys., ",
-                         "230, 1, 325-344."]),
-                "".join(["Heath, D. and Schlesinger, B. (1986). The Mg 280-nm ",
-                         "doublet as a monitor of changes in solar ",
-                         "ultraviolet irradiance, JGR, 91, 8672-8682."])])}}}}
-
     return refs[platform][name][tag][inst_id]
 
 
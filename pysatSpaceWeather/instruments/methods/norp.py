@@ -15,6 +15,42 @@ import requests
 import pysat
 
 
+# Define the acknowledgements and references for the NoRP data
+ackn = ''.join(['The Nobeyama Radio Polarimeters (NoRP) are operated by ',
+                'Solar Science Observatory, a branch of National ',
+                'Astronomical Observatory of Japan, and their observing ',
+                'data are verified scientifically by the consortium for ',
+                'NoRP scientific operations.',
+                '\nFor questions regarding the data please contact ',
+                'solar_helpdesk@ml.nao.ac.jp'])
+
+refs = {'rf': {'daily': "\n".join([
+    ''.join(['Shimojo and Iwai "Over seven decades of solar microwave ',
+             'data obtained with Toyokawa and Nobeyama Radio Polarimeters',
+             '", GDJ, 10, 114-129 (2023)']),
+    ''.join(['Nakajima et al. "The Radiometer and Polarimeters at 80, 35,',
+             ' and 17 GHz for Solar Observations at Nobeyama", PASJ, 37,',
+             ' 163 (1985)']),
+    ''.join(['Torii et al. "Full-Automatic Radiopolarimeters for Solar ',
+             'Patrol at Microwave Frequencies", Proc. of the Res. Inst. ',
+             'of Atmospherics, Nagoya Univ., 26, 129 (1979)']),
+    ''.join(['Shibasaki et al. "Solar Radio Data Acquisition and ',
+             'Communication System (SORDACS) of Toyokawa Observatory", ',
+             'Proc. of the Res. Inst. of Atmospherics, Nagoya Univ., 26, ',
+             '117 (1979)']),
+    'Tanaka, "Toyokawa Observatory", Solar Physics, 1, 2, 295 (1967)',
+    ''.join(['Tsuchiya and Nagase "Atmospheric Absorption in Microwave ',
+             'Solar Observation and Solar Flux Measurement at 17 Gc/s", ',
+             'PASJ, 17, 86 (1965)']),
+    ''.join(['Tanaka and Kakinuma. "EQUIPMENT FOR THE OBSERVATION OF SOLAR',
+             ' RADIO EMISSION AT 9400, 3750, 2000 AND 1000 Mc/s", Proc. ',
+             'of the Res. Inst. of Atmospherics, Nagoya Univ., 4, 60 ',
+             '(1957)']),
+    ''.join(['Tanaka et al. "EQUIPMENT FOR THE OBSERVATION OF SOLAR NOISE ',
+             'AT 3,750 MC", Proc. of the Res. Inst. of Atmospherics, ',
+             'Nagoya Univ., 1, 71 (1953)'])])}}
+
+
 def acknowledgements():
     """Define the acknowledgements for NoRP data.
 
@@ -24,14 +60,6 @@ def acknowledgements():
         Acknowledgements associated with the appropriate NoRP name and tag.
 
     """
-    ackn = ''.join(['The Nobeyama Radio Polarimeters (NoRP) are operated by ',
-                    'Solar Science Observatory, a branch of National ',
-                    'Astronomical Observatory of Japan, and their observing ',
-                    'data are verified scientifically by the consortium for ',
-                    'NoRP scientific operations.',
-                    '\nFor questions regarding the data please contact ',
-                    'solar_helpdesk@ml.nao.ac.jp'])
-
     return ackn
 
 
@@ -51,32 +79,6 @@ def references(name, tag):
         Reference string associated with the appropriate F10.7 tag.
 
     """
-    refs = {'rf': {'daily': "\n".join([
-        ''.join(['Shimojo and Iwai "Over seven decades of solar microwave ',
-                 'data obtained with Toyokawa and Nobeyama Radio Polarimeters',
-                 '", GDJ, 10, 114-129 (2023)']),
-        ''.join(['Nakajima et al. "The Radiometer and Polarimeters at 80, 35,',
-                 ' and 17 GHz for Solar Observations at Nobeyama", PASJ, 37,',
-                 ' 163 (1985)']),
-        ''.join(['Torii et al. "Full-Automatic Radiopolarimeters for Solar ',
-                 'Patrol at Microwave Frequencies", Proc. of the Res. Inst. ',
-                 'of Atmospherics, Nagoya Univ., 26, 129 (1979)']),
-        ''.join(['Shibasaki et al. "Solar Radio Data Acquisition and ',
-                 'Communication System (SORDACS) of Toyokawa Observatory", ',
-                 'Proc. of the Res. Inst. of Atmospherics, Nagoya Univ., 26, ',
-                 '117 (1979)']),
-        'Tanaka, "Toyokawa Observatory", Solar Physics, 1, 2, 295 (1967)',
-        ''.join(['Tsuchiya and Nagase "Atmospheric Absorption in Microwave ',
-                 'Solar Observation and Solar Flux Measurement at 17 Gc/s", ',
-                 'PASJ, 17, 86 (1965)']),
-        ''.join(['Tanaka and Kakinuma. "EQUIPMENT FOR THE OBSERVATION OF SOLAR',
-                 ' RADIO EMISSION AT 9400, 3750, 2000 AND 1000 Mc/s", Proc. ',
-                 'of the Res. Inst. of Atmospherics, Nagoya Univ., 4, 60 ',
-                 '(1957)']),
-        ''.join(['Tanaka et al. "EQUIPMENT FOR THE OBSERVATION OF SOLAR NOISE ',
-                 'AT 3,750 MC", Proc. of the Res. Inst. of Atmospherics, ',
-                 'Nagoya Univ., 1, 71 (1953)'])])}}
-
     return refs[name][tag]
 
 
@@ -119,7 +121,7 @@ def daily_rf_downloads(data_path, mock_download_dir=None, start=None,
         req = requests.get(url)
 
         # Test to see if the file was found on the server
-        if req.text.find('not found on this server') > 0:
+        if req.content.find(b'not found on this server') > 0:
             pysat.logger.warning(''.join(['NoRP daily flux file not found on ',
                                           'server: ', url]))
             raw_txt = None
@@ -293,11 +293,11 @@ def rewrite_daily_solar_data_file(year, outfiles, lines):
 
     # Get to the solar index data
     if year > 2000:
-        raw_data = lines.split('#---------------------------------')[-1]
+        raw_data = lines.rpartition('#---------------------------------')[-1]
         raw_data = raw_data.split('\n')[1:-1]
         optical = True
     else:
-        raw_data = lines.split('# ')[-1]
+        raw_data = lines.rpartition('# ')[-1]
         raw_data = raw_data.split('\n')
         optical = False if raw_data[0].find('Not Available') or year == 1994 \
             else True
@@ -344,51 +344,58 @@ def parse_daily_solar_data(data_lines, year, optical):
 
     Returns
     -------
-    dates : list
-        List of dates for each date/data pair in this block
+    dates : pds.DatetimeIndex
+        Dates for each date/data pair in this block
     values : dict
-        Dict of lists of values, where each key is the value name
+        Dict of value arrays, where each key is the value name
 
     """
 
     # Initialize the output
-    dates = list()
     val_keys = ['f107', 'ssn', 'ss_area', 'new_reg', 'smf', 'goes_bgd_flux',
                 'c_flare', 'm_flare', 'x_flare', 'o1_flare', 'o2_flare',
                 'o3_flare']
     optical_keys = ['o1_flare', 'o2_flare', 'o3_flare']
     xray_keys = ['c_flare', 'm_flare', 'x_flare']
-    values = {kk: list() for kk in val_keys}
-
-    # Cycle through each line in this file
-    for line in data_lines:
-        # Split the line on whitespace
-        split_line = line.split()
-
-        # Format the date
-        dfmt = "%Y %m %d" if year > 1996 else "%d %b %y"
-        dates.append(dt.datetime.strptime(" ".join(split_line[0:3]), dfmt))
-
-        # Format the data values
-        j = 0
-        for i, kk in enumerate(val_keys):
-            if year == 1994 and kk == 'new_reg':
-                # New regions only in files after 1994
-                val = -999
-            elif np.any([year == 1994 and kk in xray_keys,
-                         not optical and kk in optical_keys]):
-                # X-ray flares in files after 1994, optical flares come later
-                val = -1
-            else:
-                val = split_line[j + 3]
-                j += 1
+
+    # Determine the fill value for each value and which values are in the file
+    fill_vals = {kk: -999 if i < 5 else -1 for i, kk in enumerate(val_keys)}
+    if year == 1994:
+        # New regions and X-ray flares only in files after 1994
+        file_keys = [kk for kk in val_keys
+                     if kk != 'new_reg' and kk not in xray_keys]
+    else:
+        file_keys = list(val_keys)
+
+    if not optical:
+        # Optical flares come later
+        file_keys = [kk for kk in file_keys if kk not in optical_keys]
+
+    # Split all of the lines on whitespace at once, ignoring any extra columns
+    split_data = pds.Series(data_lines, dtype=str).str.split(expand=True)
+    if split_data.shape[1] == 0:
+        split_data = pds.DataFrame(columns=range(3 + len(file_keys)),
+                                   dtype=str)
+
+    # Format the date
+    dfmt = "%Y %m %d" if year > 1996 else "%d %b %y"
+    dates = pds.DatetimeIndex(pds.to_datetime(
+        split_data[0] + " " + split_data[1] + " " + split_data[2],
+        format=dfmt))
+
+    # Format the data values
+    values = dict()
+    for kk in val_keys:
+        if kk in file_keys:
+            val = split_data[3 + file_keys.index(kk)]
 
             if kk != 'goes_bgd_flux':
-                if val == "*":
-                    val = -999 if i < 5 else -1
-                else:
-                    val = int(val)
-            values[kk].append(val)
+                val = val.mask(val == "*", str(fill_vals[kk])).astype(
+                    np.int64)
+
+            values[kk] = val.to_numpy()
+        else:
+            values[kk] = np.full(shape=len(dates), fill_value=fill_vals[kk])
 
     return dates, values
 
@@ -753,7 +760,7 @@ def kp_ap_recent_download(name, date_array, data_path, mock_download_dir=None):
         dl_date = find_issue_date(raw_txt)
 
         # Data is the forecast value for the next three days
-        raw_data = raw_txt.split('#  Date ')[-1]
+        raw_data = raw_txt.rpartition('#  Date ')[-1]
 
         # Keep only the middle bits that matter
         raw_data = raw_data.split('\n')[1:-1]
@@ -907,28 +914,19 @@ def parse_45day_block(block_lines):
 
     Returns
     -------
-    dates : list
-        List of dates for each date/data pair in this block
-    values : list
-        List of values for each date/data pair in this block
+    dates : pds.DatetimeIndex
+        Dates for each date/data pair in this block
+    values : np.ndarray
+        Values for each date/data pair in this block
 
     """
 
-    # Initialize the output
-    dates = list()
-    values = list()
-
-    # Cycle through each line in this block
-    for line in block_lines:
-        # Split the line on whitespace
-        split_line = line.split()
-
-        # Format the dates
-        dates.extend([dt.datetime.strptime(tt, "%d%b%y")
-                      for tt in split_line[::2]])
+    # Split the whole block on whitespace, dates and values alternate
+    split_block = " ".join(block_lines).split()
 
-        # Format the data values
-        values.extend([int(vv) for vv in split_line[1::2]])
+    # Format the dates and data values
+    dates = pds.to_datetime(split_block[::2], format="%d%b%y")
+    values = np.array(split_block[1::2], dtype=np.int64)
 
     return dates, values
 
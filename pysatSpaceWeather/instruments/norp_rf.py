@@ -42,7 +42,7 @@ from pysatSpaceWeather.instruments import methods
 platform = 'norp'
 name = 'rf'
 tags = {'daily': 'Daily solar flux values'}
-inst_ids = {'': [tag for tag in tags.keys()]}
+inst_ids = {'': list(tags.keys())}
 
 # ----------------------------------------------------------------------------
 # Instrument test attributes
@@ -36,7 +36,7 @@ from pysatSpaceWeather.instruments.methods import lasp
 platform = 'sw'
 name = 'au'
 tags = {'lasp': 'Predicted AU from real-time ACE or DSCOVR provided by LASP'}
-inst_ids = {'': [tag for tag in tags.keys()]}
+inst_ids = {'': list(tags.keys())}
 
 # Generate today's date to support loading predicted data sets
 today = pysat.utils.time.today()
@@ -46,7 +46,7 @@ platform = 'sw'
 name = 'dst'
 tags = {'noaa': 'Historic Dst data coalated by and maintained by NOAA/NCEI',
         'lasp': 'Predicted Dst from real-time ACE or DSCOVR provided by LASP'}
-inst_ids = {'': [tag for tag in tags.keys()]}
+inst_ids = {'': list(tags.keys())}
 
 # Generate today's date to support loading predicted data sets
 today = pysat.utils.time.today()
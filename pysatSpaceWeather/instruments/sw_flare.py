@@ -70,7 +70,7 @@ tags = {'prelim': 'Preliminary SWPC daily solar indices',
         'prediction': 'Predictions from SWPC for the next 3 days'}
 
 # Dict keyed by inst_id that lists supported tags for each inst_id
-inst_ids = {'': [tag for tag in tags.keys()]}
+inst_ids = {'': list(tags.keys())}
 
 # Dict keyed by inst_id that lists supported tags and a good day of test data
 # generate todays date to support loading forecast data
@@ -48,7 +48,7 @@ tags = {'prelim': 'Preliminary SWPC daily solar indices',
         'daily': 'Daily SWPC solar indices (contains last 30 days)'}
 
 # Dict keyed by inst_id that lists supported tags for each inst_id
-inst_ids = {'': [tag for tag in tags.keys()]}
+inst_ids = {'': list(tags.keys())}
 
 # Dict keyed by inst_id that lists supported tags and a good day of test data
 # generate todays date to support loading forecast data
@@ -51,7 +51,7 @@ tags = {'prelim': 'Preliminary SWPC daily solar indices',
         'Nowcast and definitive international sunspot number data from GFZ'}
 
 # Dict keyed by inst_id that lists supported tags for each inst_id
-inst_ids = {'': [tag for tag in tags.keys()]}
+inst_ids = {'': list(tags.keys())}
 
 # Dict keyed by inst_id that lists supported tags and a good day of test data
 # generate todays date to support loading forecast data
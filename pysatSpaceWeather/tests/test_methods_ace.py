@@ -8,11 +8,18 @@
 # ----------------------------------------------------------------------------
 """Integration and unit test suite for ACE methods."""
 
+import datetime as dt
+import numpy as np
+import os
+from packaging import version
+import pandas as pds
 import pytest
 
 import pysat
 
+import pysatSpaceWeather as psw
 from pysatSpaceWeather.instruments.methods import ace as mm_ace
+from pysatSpaceWeather.instruments.methods import general
 
 
 class TestACEMethods(object):
@@ -59,6 +66,124 @@ class TestACEMethods(object):
         assert str(aerr.value).find("Can't apply ACE cleaning to platform") >= 0
         return
 
+    def test_common_metadata(self):
+        """Test the common ACE metadata is assigned for the default labels."""
+        self.out, status_desc = mm_ace.common_metadata()
+
+        assert status_desc == mm_ace.status_desc
+        for var in mm_ace.common_var_meta.keys():
+            assert var in self.out.keys()
+            for lkey, lval in mm_ace.common_var_meta[var].items():
+                mval = self.out[var, getattr(self.out.labels, lkey)]
+                assert (mval == lval) or (np.isnan(mval) and np.isnan(lval))
+        return
+
+    def test_get_read_csv_kwargs(self):
+        """Test the ACE file loading kwargs specify all column data types."""
+        self.out = mm_ace.get_read_csv_kwargs({'status': {}})
+
+        assert self.out['index_col'] == 0
+        assert list(self.out['dtype'].keys()) == ['jd', 'sec', 'status']
+        assert np.all([dtype == np.float64
+                       for dtype in self.out['dtype'].values()])
+
+        # Ensure the module kwargs are not modified
+        assert 'dtype' not in mm_ace.read_csv_kwargs.keys()
+        return
+
+    def test_convert_status_dtype(self):
+        """Test the status flags are converted to the status data type."""
+        self.out = mm_ace.convert_status_dtype(pds.DataFrame(
+            {'status_e': [0.0, 9.0], 'eflux_38-53': [1.0, -1.0e5]}))
+
+        assert self.out['status_e'].dtype == mm_ace.status_dtype
+        assert self.out['eflux_38-53'].dtype == np.float64
+        assert list(self.out['status_e']) == [0, 9]
+        return
+
+    def test_convert_status_dtype_empty(self):
+        """Test an empty DataFrame is returned unchanged."""
+        self.out = mm_ace.convert_status_dtype(pds.DataFrame())
+
+        assert self.out.empty
+        return
+
+    @pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+    def test_convert_index_unit(self, tmp_path, engine):
+        """Test the loaded index resolution does not depend on the parser.
+
+        Parameters
+        ----------
+        engine : str
+            CSV parser used to load the test file
+
+        """
+        if engine == 'pyarrow':
+            pytest.importorskip(engine)
+
+        # Write a file in the ACE CSV format
+        fname = str(tmp_path / 'ace_test.txt')
+        with open(fname, 'w') as fout:
+            fout.write(',jd,sec,status_e\n')
+            fout.write('2009-01-01 00:00:00,54832,0,0\n')
+            fout.write('2009-01-01 00:05:00,54832,300,9\n')
+
+        # Load the file and convert the index
+        read_kwargs = dict(mm_ace.read_csv_kwargs)
+        read_kwargs['engine'] = engine
+        self.out = mm_ace.convert_index_unit(general.load_csv_data(
+            fname, read_csv_kwargs=read_kwargs))
+
+        unit = 'ns' if mm_ace.index_unit is None else mm_ace.index_unit
+        assert self.out.index.dtype == np.dtype('datetime64[{:s}]'.format(unit))
+        assert self.out.index[1] == dt.datetime(2009, 1, 1, 0, 5)
+        return
+
+    def test_convert_index_unit_no_unit(self, monkeypatch):
+        """Test the index is unchanged without a unit, as for pandas < 2.0."""
+        monkeypatch.setattr(mm_ace, 'index_unit', None)
+
+        index = pds.DatetimeIndex([dt.datetime(2009, 1, 1, 0, 0),
+                                   dt.datetime(2009, 1, 1, 0, 5)])
+        self.out = mm_ace.convert_index_unit(
+            pds.DataFrame({'jd': [54832, 54832]}, index=index))
+
+        assert self.out.index.dtype == index.dtype
+        assert self.out.index.equals(index)
+        return
+
+    def test_csv_engine(self):
+        """Test the pyarrow CSV parser is only used with pandas 1.4+."""
+
+        if mm_ace.csv_engine == 'pyarrow':
+            assert version.Version(pds.__version__) >= version.Version('1.4.0')
+        else:
+            assert mm_ace.csv_engine == 'c'
+        assert mm_ace.read_csv_kwargs['engine'] == mm_ace.csv_engine
+        return
+
+    def test_convert_index_unit_empty(self):
+        """Test an empty DataFrame is returned unchanged."""
+        self.out = mm_ace.convert_index_unit(pds.DataFrame())
+
+        assert self.out.empty
+        return
+
+    def test_update_metadata_custom_labels(self):
+        """Test ACE metadata is assigned to custom metadata labels."""
+        self.out = pysat.Meta(labels={'units': ('Units', str),
+                                      'name': ('Long_Name', str),
+                                      'notes': ('Notes', str),
+                                      'desc': ('Description', str),
+                                      'min_val': ('Minimum', (int, float)),
+                                      'max_val': ('Maximum', (int, float)),
+                                      'fill_val': ('Fill', (int, float))})
+        mm_ace.update_metadata(self.out, mm_ace.common_var_meta)
+
+        assert self.out['jd', 'Units'] == 'days'
+        assert self.out['sec', 'Long_Name'] == 'Sec of Day'
+        return
+
 
 class TestACESWEPAMMethods(object):
     """Test class for ACE SWEPAM methods."""
@@ -101,3 +226,107 @@ class TestACESWEPAMMethods(object):
         assert str(verr).find("instrument missing variable") >= 0
 
         return
+
+
+class TestACEDownloadMethods(object):
+    """Test class for ACE download methods."""
+
+    def setup_method(self):
+        """Create a clean testing setup."""
+        self.now = dt.datetime(2023, 11, 1, tzinfo=dt.timezone.utc)
+        self.date_array = [dt.datetime(2023, 11, 1)]
+        with open(os.path.join(psw.test_data_path, 'ace-swepam.txt'),
+                  'r') as fin:
+            self.raw_text = fin.read()
+        self.out = None
+        return
+
+    def teardown_method(self):
+        """Clean up previous testing setup."""
+        del self.now, self.date_array, self.raw_text, self.out
+        return
+
+    def test_download_realtime(self, tmp_path):
+        """Test the real-time file is parsed and written as expected."""
+        mm_ace.download(self.date_array, 'swepam', tag='realtime',
+                        data_path=str(tmp_path), now=self.now,
+                        mock_download_dir=psw.test_data_path)
+
+        data = pds.read_csv(os.path.join(
+            str(tmp_path), 'ace_swepam_realtime_2023-11-01.txt'), index_col=0,
+            parse_dates=True)
+
+        assert list(data.columns) == ['jd', 'sec', 'status', 'sw_proton_dens',
+                                      'sw_bulk_speed', 'sw_ion_temp']
+        assert data.index[0] == dt.datetime(2023, 11, 1, 15, 42)
+        assert data['sw_bulk_speed'].iloc[0] == 437.8
+        return
+
+    def test_download_realtime_recent_file(self, tmp_path):
+        """Test a recently written real-time file is not downloaded again."""
+        data_file = str(tmp_path / 'ace_swepam_realtime_2023-11-01.txt')
+        with open(data_file, 'w') as fout:
+            fout.write(self.raw_text)
+
+        mm_ace.download(self.date_array, 'swepam', tag='realtime',
+                        data_path=str(tmp_path), now=self.now)
+
+        with open(data_file, 'r') as fin:
+            assert fin.read() == self.raw_text
+        return
+
+    def test_download_historic_concurrent(self, tmp_path):
+        """Test concurrent historic downloads match sequential downloads."""
+        # Create a mock download directory with files for several days
+        mock_dir = tmp_path / 'mock'
+        mock_dir.mkdir()
+        with open(os.path.join(psw.test_data_path,
+                               '20090101_ace_mag_1m.txt'), 'r') as fin:
+            raw_text = fin.read()
+
+        self.date_array = pds.date_range('2009-01-01', periods=3, freq='1D')
+        for dl_date in self.date_array:
+            with open(str(mock_dir / dl_date.strftime(
+                    '%Y%m%d_ace_mag_1m.txt')), 'w') as fout:
+                fout.write(raw_text)
+
+        # Download the files sequentially and concurrently
+        for max_workers in [1, 3]:
+            data_dir = tmp_path / str(max_workers)
+            data_dir.mkdir()
+            mm_ace.download(self.date_array, 'mag', tag='historic',
+                            data_path=str(data_dir),
+                            mock_download_dir=str(mock_dir),
+                            max_workers=max_workers)
+
+        # Compare the output files
+        for dl_date in self.date_array:
+            data_file = dl_date.strftime('ace_mag_historic_%Y-%m-%d.txt')
+            with open(str(tmp_path / '1' / data_file), 'r') as fin:
+                self.out = fin.read()
+
+            with open(str(tmp_path / '3' / data_file), 'r') as fin:
+                assert fin.read() == self.out
+        return
+
+    @pytest.mark.parametrize('bad_line', ['2023 11 01  1544   60249',
+                                          '2023 11 01  1544   60249   56640'
+                                          '    1 1.0 400.0 9.0e+04 1.0',
+                                          '2023-11-01 1544 60249 56640 0',
+                                          'Data gap \f'])
+    def test_download_bad_line(self, tmp_path, bad_line):
+        """Test an IOError is raised for unexpected lines in the file."""
+        # Create a mock download file with a bad data line
+        mock_dir = tmp_path / 'mock'
+        mock_dir.mkdir()
+        with open(str(mock_dir / 'ace-swepam.txt'), 'w') as fout:
+            fout.write('\n'.join([self.raw_text.rstrip(), bad_line, '']))
+
+        with pytest.raises(IOError) as ierr:
+            mm_ace.download(self.date_array, 'swepam', tag='realtime',
+                            data_path=str(tmp_path), now=self.now,
+                            mock_download_dir=str(mock_dir))
+
+        assert str(ierr.value).find('unexpected line encoutered') >= 0
+        assert str(ierr.value).find(bad_line.split()[0]) >= 0
+        return
@@ -9,6 +9,7 @@
 """Integration and unit test suite for ACE methods."""
 
 import numpy as np
+import pandas as pds
 import pytest
 
 import pysat
@@ -45,6 +46,58 @@ class TestGeneralMethods(object):
             self.testInst.meta[self.var, self.testInst.meta.labels.fill_val])
         return
 
+    def test_get_instrument_data_path_cached(self):
+        """Test the Instrument data path is only evaluated once per input."""
+
+        general._get_instrument_data_path.cache_clear()
+
+        # Get the data path twice and test the second result came from cache
+        data_path = general.get_instrument_data_path('sw_f107', tag='daily')
+        assert data_path == general.get_instrument_data_path('sw_f107',
+                                                             tag='daily')
+        assert general._get_instrument_data_path.cache_info().hits == 1
+        assert data_path.find('f107') >= 0
+        return
+
+    def test_get_instrument_data_path_directory_format(self):
+        """Test the cached Instrument data path follows the directory format."""
+
+        # Get the data path with the current directory format
+        dir_format = pysat.params['directory_format']
+        data_path = general.get_instrument_data_path('sw_f107', tag='daily')
+
+        # Change the directory format and get the data path again
+        try:
+            pysat.params['directory_format'] = '{platform}_{name}_{tag}'
+            new_path = general.get_instrument_data_path('sw_f107',
+                                                        tag='daily')
+        finally:
+            pysat.params['directory_format'] = dir_format
+
+        # Test the output
+        assert new_path != data_path
+        assert new_path.find('sw_f107_daily') >= 0
+        assert data_path == general.get_instrument_data_path('sw_f107',
+                                                             tag='daily')
+        return
+
+    @pytest.mark.parametrize("pool_maxsize", [1, 16])
+    def test_new_remote_session(self, pool_maxsize):
+        """Test remote sessions share the retry policy and set the pool size.
+
+        Parameters
+        ----------
+        pool_maxsize : int
+            Maximum number of pooled connections
+
+        """
+        with general.new_remote_session(pool_maxsize=pool_maxsize) as session:
+            adapter = session.get_adapter('https://')
+
+            assert adapter.max_retries is general.remote_retries
+            assert adapter._pool_maxsize == pool_maxsize
+        return
+
     @pytest.mark.parametrize("fill_val", [-1.0, -1, np.nan, np.inf, ''])
     def test_is_fill(self, fill_val):
         """Test the successful evaluation of fill values.
@@ -65,3 +118,73 @@ class TestGeneralMethods(object):
         # Evaluate the fill value is a fill value
         assert general.is_fill_val(fill_val, fill_val)
         return
+
+
+class TestLoadCSVData(object):
+    """Test class for the parallel CSV loading method."""
+
+    def setup_method(self):
+        """Create a clean testing setup."""
+        self.data = pds.DataFrame({'a': np.arange(0.0, 20.0),
+                                   'b': np.arange(20.0, 40.0)},
+                                  index=pds.date_range('2009-01-01',
+                                                       periods=20, freq='1h'))
+        self.read_kwargs = {'index_col': 0, 'parse_dates': True}
+        return
+
+    def teardown_method(self):
+        """Clean up previous testing setup."""
+        del self.data, self.read_kwargs
+        return
+
+    @pytest.mark.parametrize("nfiles", [1, 4])
+    def test_load_csv_data(self, tmp_path, nfiles):
+        """Test the CSV data is loaded in file order.
+
+        Parameters
+        ----------
+        nfiles : int
+            Number of files to split the test data across
+
+        """
+        # Write the test data into separate files
+        fnames = list()
+        ibounds = np.linspace(0, len(self.data), nfiles + 1, dtype=int)
+        for i in range(nfiles):
+            fnames.append(str(tmp_path / 'test_{:d}.csv'.format(i)))
+            self.data.iloc[ibounds[i]:ibounds[i + 1]].to_csv(fnames[-1],
+                                                             header=True)
+
+        # Load the data and compare to the pysat serial loading routine
+        data = general.load_csv_data(fnames, read_csv_kwargs=self.read_kwargs)
+        pysat_data = pysat.instruments.methods.general.load_csv_data(
+            fnames, read_csv_kwargs=self.read_kwargs)
+
+        assert data.equals(pysat_data)
+        assert data.index.name == pysat_data.index.name
+        assert np.all(data.values == self.data.values)
+        return
+
+    def test_load_csv_data_pyarrow(self, tmp_path):
+        """Test the index is named when loading with the pyarrow engine."""
+        pytest.importorskip("pyarrow")
+
+        # Write the test data into a file with an unlabeled index
+        fname = str(tmp_path / 'test.csv')
+        self.data.to_csv(fname, header=True)
+
+        # Load the data and test the output
+        self.read_kwargs['engine'] = 'pyarrow'
+        data = general.load_csv_data(fname, read_csv_kwargs=self.read_kwargs)
+
+        assert data.index.name == "Epoch"
+        assert np.all(data.values == self.data.values)
+        return
+
+    def test_load_csv_data_no_files(self):
+        """Test an empty DataFrame is returned when no files are supplied."""
+
+        data = general.load_csv_data([])
+
+        assert data.empty
+        return
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.3986138
+#
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Unit tests for the pysatSpaceWeather version information."""
+
+import importlib.metadata
+
+import pytest
+
+import pysatSpaceWeather as psw
+
+
+class TestVersion(object):
+    """Test class for the package version."""
+
+    def test_version_matches_metadata(self):
+        """Test the static version matches the installed package metadata."""
+        try:
+            meta_version = importlib.metadata.version('pysatSpaceWeather')
+        except importlib.metadata.PackageNotFoundError:
+            pytest.skip("pysatSpaceWeather package metadata is not installed")
+
+        assert psw.__version__ == meta_version
+        return